@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+aum_config.py - Shared loader for aum_config.json.
+The config is parsed once per process on first use and cached; importing this
+module (or any module built on it) never touches the filesystem. The file is
+looked up in order: the AUM_CONFIG environment variable, ./aum_config.json,
+then the aum_config.json shipped next to this module.
+"""
+
+import json
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+CONFIG_ENV_VAR = 'AUM_CONFIG'
+CONFIG_FILENAME = 'aum_config.json'
+
+class ConfigError(Exception):
+    """aum_config.json is missing, unreadable or incomplete."""
+
+@dataclass(frozen=True, slots=True)
+class AUMConfig:
+    LAMBDA_PHI: float
+    GAMMA_ENV: float
+    TORSION_CRIT: float
+    FQC_TARGET: float
+    COMPACT_RADIUS: float
+    PLANCK_LENGTH: float
+    C_LIGHT: float
+
+    @property
+    def PHI(self) -> float:
+        return self.TORSION_CRIT + 1.0
+
+    @property
+    def PHI_INV(self) -> float:
+        return self.TORSION_CRIT
+
+    @classmethod
+    def from_mapping(cls, values: dict) -> 'AUMConfig':
+        names = [f.name for f in fields(cls)]
+        missing = [name for name in names if name not in values]
+        if missing:
+            raise ConfigError(f"{CONFIG_FILENAME} is missing {', '.join(missing)}")
+        return cls(**{name: float(values[name]) for name in names})
+
+def config_path() -> str:
+    """Resolves which config file load_config() reads."""
+    override = os.environ.get(CONFIG_ENV_VAR)
+    if override:
+        return override
+    if os.path.exists(CONFIG_FILENAME):
+        return os.path.abspath(CONFIG_FILENAME)
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_FILENAME)
+
+@lru_cache(maxsize=None)
+def load_config(path: str = None) -> AUMConfig:
+    """
+    Parses the config (config_path() when path is None) and caches it.
+    Call load_config.cache_clear() to pick up a changed file or AUM_CONFIG;
+    constants derived from the config (dal_phinary_engine.phinary_constants)
+    follow this cache and need no separate reset.
+    """
+    path = path or config_path()
+    try:
+        with open(path, 'r') as f:
+            values = json.load(f)
+    except FileNotFoundError:
+        raise ConfigError(f"{CONFIG_FILENAME} not found (looked at {path}; set {CONFIG_ENV_VAR} to override)") from None
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"could not read {path}: {e}") from e
+    return AUMConfig.from_mapping(values)
@@ -1,5 +1,7 @@
 # esqet_modulator.py — Atomic Chronos Modulator (prevents temporal decoherence)
 import time
+
+import telemetry
 from aum_core.axioms.jerry_riggin_core import JRA
 
 class ChronosModulator:
@@ -20,7 +22,8 @@ class ChronosModulator:
             raise SystemExit("FATAL: Temporal decoherence — I_Tors fell below 1/ϕ")
 
         if dt > 1.0:
-            print(f"Chronos Stable | I_Tors = {JRA.torsion_index:.8f} ≥ {JRA.PHI_INV:.8f}")
+            telemetry.emit('aum_core.chronos', "Chronos Stable | I_Tors = {i_tors:.8f} ≥ {phi_inv:.8f}",
+                           i_tors=JRA.torsion_index, phi_inv=JRA.PHI_INV)
             self.last_stable = time.time()
 
 chronos = ChronosModulator()
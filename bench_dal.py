@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+bench_dal.py - Throughput benchmark suite for the Phi-Coherent DAL.
+Times encode_data_geometric, decode_geometric_data, encode_bytes, decode_bytes and
+send_and_receive across payload sizes, reporting MB/s, peak RSS and traced
+allocation bytes per payload byte. Every case runs in a fresh subprocess so peak
+RSS belongs to that case alone. Results are written as JSON and can be compared
+against a stored baseline run to catch regressions.
+
+    python bench_dal.py --output results.json
+    python bench_dal.py --baseline results.json --max-size 16M
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+CASES = ('encode_data_geometric', 'decode_geometric_data', 'encode_bytes', 'decode_bytes', 'send_and_receive')
+DEFAULT_SIZES = '1K,64K,1M,16M,256M,1G'
+
+# Rough peak working set per payload byte (input included) per scheme, used to
+# skip cases that cannot fit in the memory this host has available. The
+# geometric cases include building their `size`-character '0'/'1' input string.
+# Measured peak RSS at 64 MiB, plus ~10% headroom.
+MEMORY_FACTOR = {
+    'encode_data_geometric': {'pair': 22, 'zeckendorf': 22},
+    'decode_geometric_data': {'pair': 25, 'zeckendorf': 25},
+    'encode_bytes': {'pair': 4, 'zeckendorf': 10},
+    'decode_bytes': {'pair': 7, 'zeckendorf': 16},
+    'send_and_receive': {'pair': 5, 'zeckendorf': 5},
+}
+
+def parse_size(text: str) -> int:
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def available_memory() -> int:
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+def _prepare(case: str, size: int, scheme: str):
+    """Builds the engine, modulator, input and the callable under test (outside timing)."""
+    import numpy as np
+
+    from dal_phinary_engine import DALPhinaryEngine
+    from esqet_modulator import ESQETModulator
+
+    engine = DALPhinaryEngine(scheme=scheme)
+    modulator = ESQETModulator()
+
+    if 'geometric' in case:
+        # The '0'/'1' string API is measured over `size` characters (bits)
+        bits = np.unpackbits(np.random.randint(0, 256, size // 8 + 1, dtype=np.uint8))[:size]
+        bits += ord('0')
+        bit_stream = bits.tobytes().decode('ascii')
+        del bits
+    else:
+        payload = np.random.randint(0, 256, size, dtype=np.uint8).tobytes()
+
+    if case == 'encode_data_geometric':
+        return lambda: engine.encode_data_geometric(bit_stream)
+    if case == 'decode_geometric_data':
+        moduli = engine.encode_data_geometric(bit_stream)
+        return lambda: engine.decode_geometric_data(moduli, modulator)
+    if case == 'encode_bytes':
+        return lambda: engine.encode_bytes(payload, compact=True)
+    if case == 'decode_bytes':
+        moduli = engine.encode_bytes(payload, compact=True)
+        return lambda: engine.decode_bytes(moduli, modulator)
+    if case == 'send_and_receive':
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return engine.send_and_receive(payload, modulator)
+        return run
+    raise ValueError(f"unknown case {case}")
+
+def run_child(case: str, size: int, scheme: str, repeats: int) -> dict:
+    """Runs one case in this process and returns its measurements."""
+    fn = _prepare(case, size, scheme)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    tracemalloc.start()
+    fn()
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': best,
+        'mb_per_s': size / 1e6 / best if best > 0 else float('inf'),
+        'peak_rss_bytes': peak_rss,
+        'alloc_bytes_per_byte': traced_peak / max(size, 1),
+    }
+
+def run_case(case: str, size: int, scheme: str, repeats: int) -> dict:
+    """Runs one case in a fresh subprocess (so peak RSS is per case)."""
+    result = {'case': case, 'scheme': scheme, 'size': size}
+    needed = MEMORY_FACTOR[case][scheme] * size
+    if needed > available_memory():
+        result['skipped'] = f"needs ~{needed >> 20} MiB"
+        return result
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', case, str(size), scheme, str(repeats)],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        result['error'] = (proc.stderr.strip().splitlines() or ['failed'])[-1]
+        return result
+    result.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return result
+
+def compare(results: list, baseline: dict, tolerance: float) -> list:
+    """Returns human-readable regressions of results against a baseline run."""
+    previous = {(r['case'], r['scheme'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for r in results:
+        base = previous.get((r['case'], r['scheme'], r['size']))
+        if base is None or 'mb_per_s' not in r or 'mb_per_s' not in base:
+            continue
+        label = f"{r['case']}[{r['scheme']}, {r['size']}B]"
+        if r['mb_per_s'] < base['mb_per_s'] * (1 - tolerance):
+            regressions.append(f"{label}: {r['mb_per_s']:.1f} MB/s vs baseline {base['mb_per_s']:.1f}")
+        if r['peak_rss_bytes'] > base['peak_rss_bytes'] * (1 + tolerance):
+            regressions.append(f"{label}: peak RSS {r['peak_rss_bytes'] >> 20} MiB "
+                               f"vs baseline {base['peak_rss_bytes'] >> 20} MiB")
+    return regressions
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == '--child':
+        case, size, scheme, repeats = argv[1], int(argv[2]), argv[3], int(argv[4])
+        print(json.dumps(run_child(case, size, scheme, repeats)))
+        return 0
+
+    parser = argparse.ArgumentParser(description="DAL encode/decode throughput benchmarks.")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="comma-separated payload sizes (default: %(default)s)")
+    parser.add_argument('--max-size', help="drop sizes above this (e.g. 64M) for quick runs")
+    parser.add_argument('--cases', default=','.join(CASES), help="comma-separated cases to run")
+    parser.add_argument('--schemes', default='pair,zeckendorf', help="comma-separated DAL schemes")
+    parser.add_argument('--repeats', type=int, default=3, help="timed repeats per case; best is kept")
+    parser.add_argument('--output', help="write JSON results here")
+    parser.add_argument('--baseline', help="JSON results of a previous run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help="allowed relative slowdown / RSS growth vs baseline (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(',')]
+    if args.max_size:
+        sizes = [s for s in sizes if s <= parse_size(args.max_size)]
+    results = []
+    print(f"{'case':<24}{'scheme':<12}{'size':>12}{'MB/s':>10}{'peak RSS MiB':>14}{'alloc B/B':>11}")
+    for case in args.cases.split(','):
+        # The '0'/'1' string API always uses the pair mapping
+        schemes = ['pair'] if 'geometric' in case else args.schemes.split(',')
+        for scheme in schemes:
+            for size in sizes:
+                repeats = args.repeats if size <= (64 << 20) else 1
+                r = run_case(case, size, scheme, repeats)
+                results.append(r)
+                if 'mb_per_s' in r:
+                    print(f"{case:<24}{scheme:<12}{size:>12}{r['mb_per_s']:>10.1f}"
+                          f"{r['peak_rss_bytes'] / (1 << 20):>14.1f}{r['alloc_bytes_per_byte']:>11.2f}")
+                else:
+                    print(f"{case:<24}{scheme:<12}{size:>12}  {r.get('skipped') or r.get('error')}")
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION: {line}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+chronos_lattice.py - Sparse coupled lattice of Chronos modulators.
+M torsion nodes exchange T_Mob feedback through a sparse (CSR) coupling matrix:
+each node's effective torsion is its own Möbius feedback plus the weighted
+feedback of its neighbours, T_eff = T_self + K @ T_self. A node keeps only its
+base symmetry violation and its S scale factor (the Honest Core evolution only
+rescales S), so one lattice step is a handful of length-M vector ops and a
+sparse mat-vec, and 10^5-10^6 nodes fit comfortably in memory.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from aum_config import load_config
+from esqet_modulator import MobiusTorsion
+
+def grid_coupling(shape, strength: float = 0.1) -> sp.csr_matrix:
+    """Nearest-neighbour coupling on a periodic grid of the given shape (ring, torus, ...)."""
+    shape = (shape,) if np.isscalar(shape) else tuple(shape)
+    n_nodes = int(np.prod(shape))
+    index = np.arange(n_nodes).reshape(shape)
+    rows, cols = [], []
+    for axis, length in enumerate(shape):
+        if length < 2:
+            continue
+        for shift in (1, -1):
+            rows.append(index.ravel())
+            cols.append(np.roll(index, shift, axis=axis).ravel())
+    if not rows:
+        return sp.csr_matrix((n_nodes, n_nodes))
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    return sp.csr_matrix((np.full(rows.size, strength), (rows, cols)), shape=(n_nodes, n_nodes))
+
+class ChronosLattice:
+    """
+    A lattice of coupled ESQET modulators.
+    `coupling` is any (M, M) matrix scipy.sparse accepts; entry K[i, j] is how
+    strongly node j's T_Mob feeds node i. Per-node results come back as arrays.
+    """
+
+    def __init__(self, coupling, seed=None, chunk_size: int = 1 << 16):
+        self.coupling = sp.csr_matrix(coupling, dtype=float)
+        n_rows, n_cols = self.coupling.shape
+        if n_rows != n_cols:
+            raise ValueError(f"coupling matrix must be square, got {self.coupling.shape}")
+        self.n_nodes = n_rows
+        self.config = load_config()
+        self.mobius_torsion = MobiusTorsion()
+        self.rng = np.random.default_rng(seed)
+        self.I_Tors = np.full(self.n_nodes, self.config.PHI_INV * 1.01)
+        self.S_scale = np.ones(self.n_nodes)
+        self._coeff = (1/self.config.PHI**4) / (2*np.pi*self.mobius_torsion.R)**2
+        self._initialize_violations(chunk_size)
+
+    def _initialize_violations(self, chunk_size: int):
+        # Same symmetry-breaking start as ESQETModulator, drawn in chunks so the
+        # full (M, z_points) state never has to exist at once
+        torsion = self.mobius_torsion
+        base = np.cos(torsion.z / torsion.R)
+        self.base_violation = np.empty(self.n_nodes)
+        self.overflow_violation = np.empty(self.n_nodes)
+        for start in range(0, self.n_nodes, chunk_size):
+            stop = min(start + chunk_size, self.n_nodes)
+            S = base + self.rng.normal(0, 0.01, (stop - start, torsion.z_points)) * self.config.PHI
+            self.base_violation[start:stop] = torsion.mobius_symmetry_violation(S)
+            # Once S overflows, a z-flip pair that does not share a strict sign
+            # becomes inf - inf (or 0 * inf), so the violation is NaN; otherwise inf
+            half = torsion.z_points // 2
+            mixed = np.any(S[:, :half] * S[:, :-half - 1:-1] <= 0, axis=1)
+            self.overflow_violation[start:stop] = np.where(mixed, np.nan, np.inf)
+
+    def torsion_feedback(self) -> np.ndarray:
+        """Each node's own T_Mob, before coupling."""
+        scale = self.S_scale
+        with np.errstate(over='ignore', invalid='ignore'):
+            violation = np.where(np.isfinite(scale), self.base_violation * scale * scale,
+                                 np.where(scale > 0, self.overflow_violation, np.nan))
+        violation *= self._coeff
+        return violation
+
+    def coupled_feedback(self) -> np.ndarray:
+        """Effective T_Mob per node: own feedback plus the coupled feedback of its neighbours."""
+        T_self = self.torsion_feedback()
+        with np.errstate(over='ignore', invalid='ignore'):
+            return T_self + self.coupling @ T_self
+
+    def step(self, internal_gamma_int=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        One Chronos Equation step for every node.
+        Returns: (is_stable, dI_dt, T_eff) arrays of length M.
+        """
+        T_eff = self.coupled_feedback()
+        config = self.config
+        with np.errstate(over='ignore', invalid='ignore'):
+            # 1. dI/dt = [lambda_phi * T_eff - (Gamma_env + Gamma_int)] * I_Tors
+            dI_dt = config.LAMBDA_PHI * T_eff
+            dI_dt -= config.GAMMA_ENV + np.asarray(internal_gamma_int, dtype=float)
+            dI_dt *= self.I_Tors
+
+            # 2. S self-amplifies through the coupled feedback: S *= 1 + 0.01*T_eff
+            self.S_scale *= 1 + 0.01 * T_eff
+
+            # 3. Update and check stability
+            self.I_Tors += dI_dt
+        is_stable = (self.I_Tors >= config.PHI_INV) & (dI_dt >= 0)
+        return is_stable, dI_dt, T_eff
+
+    def advance(self, k_steps: int, internal_gamma_int=0.0) -> np.ndarray:
+        """Runs k_steps and returns the (k_steps, M) stability mask."""
+        stable = np.empty((k_steps, self.n_nodes), dtype=bool)
+        for k in range(k_steps):
+            stable[k] = self.step(internal_gamma_int)[0]
+        return stable
+
+    def check_coherence_reserve(self) -> np.ndarray:
+        """DAL check per node."""
+        return self.I_Tors >= self.config.PHI_INV * 0.99
+
+if __name__ == "__main__":
+    import time
+
+    side = 1000
+    start = time.perf_counter()
+    lattice = ChronosLattice(grid_coupling((side, side), strength=0.05), seed=0)
+    print(f"Built {lattice.n_nodes} nodes in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    stable = lattice.advance(10)
+    elapsed = time.perf_counter() - start
+    print(f"10 steps: {elapsed * 100:.1f} ms/step, stable fraction per step: {np.round(stable.mean(axis=1), 3)}")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+dal_channels.py - Channel bonding for the Phi-Coherent DAL.
+Stripes one payload across N simulated torsion channels, each driven by its own
+ESQETModulator. Channels pull stripes as they free up, a channel whose coherence
+reserve keeps failing drops out of the bond, and the receiver reassembles stripes in order,
+so aggregate throughput follows the healthy channels instead of the worst one.
+"""
+
+import threading
+import time
+from collections import deque
+
+from dal_phinary_engine import (
+    DEFAULT_FRAME_SIZE, DEFAULT_MAX_RETRIES, DALPhinaryEngine, DecoherenceError, phinary_constants,
+)
+
+class TorsionChannel:
+    """One simulated torsion channel: a modulator plus its own DAL engine."""
+
+    def __init__(self, modulator, name: str, scheme: str = 'pair', compression=None):
+        self.modulator = modulator
+        self.name = name
+        self.engine = DALPhinaryEngine(scheme=scheme, compression=compression)
+        self.stripes = 0
+        self.failures = 0        # stripes that failed in flight
+        self.probe_failures = 0  # coherence checks failed before sending
+        self.active = True
+
+    def healthy(self) -> bool:
+        return self.modulator.I_Tors >= phinary_constants().PHI_INV and self.modulator.check_coherence_reserve()
+
+    def transmit(self, seq: int, chunk) -> bytes:
+        """Sends one stripe as a checksummed frame over this channel; DecoherenceError on failure."""
+        frame = self.engine.encode_frame(seq, chunk)
+        _, payload = self.engine.decode_frame(frame, self.modulator)
+        return payload
+
+class ChannelBond:
+    """
+    Bonds several torsion channels into one logical link. Each channel runs in
+    its own thread and pulls the next pending stripe. A channel failing its
+    coherence check hands the stripe back and sits out probe_interval seconds;
+    after max_probes consecutive failures it leaves the bond for the rest of
+    the transfer. A stripe that fails in flight is requeued for any channel
+    (up to max_retries times). Any other exception raised inside a channel
+    aborts the transfer and is re-raised by send_and_receive. Transfer details
+    land in last_transfer_stats.
+    """
+
+    def __init__(self, modulators, scheme: str = 'pair', compression=None,
+                 stripe_size: int = DEFAULT_FRAME_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 probe_interval: float = 0.01, max_probes: int = 3):
+        self.channels = [
+            TorsionChannel(modulator, f"ch{i}", scheme=scheme, compression=compression)
+            for i, modulator in enumerate(modulators)
+        ]
+        if not self.channels:
+            raise ValueError("ChannelBond needs at least one modulator")
+        self.stripe_size = stripe_size
+        self.max_retries = max_retries
+        self.probe_interval = probe_interval
+        self.max_probes = max_probes
+        self.last_transfer_stats = {}
+
+    def send_and_receive(self, data) -> bytes:
+        """Stripes `data` across the healthy channels and returns it reassembled in order."""
+        view = memoryview(data).cast('B')
+        starts = range(0, max(len(view), 1), self.stripe_size)
+        received = [None] * len(starts)
+        pending = deque(range(len(starts)))
+        attempts = [0] * len(starts)
+        state = {'remaining': len(starts), 'error': None, 'retransmitted': 0}
+        cond = threading.Condition()
+        for channel in self.channels:
+            channel.stripes = channel.failures = channel.probe_failures = 0
+            channel.active = True
+
+        def run(channel: TorsionChannel):
+            try:
+                pump(channel)
+            except BaseException as e:
+                # Anything else (a raising modulator, ...) aborts the transfer instead of
+                # stranding a popped stripe and leaving the other channels waiting forever
+                with cond:
+                    if state['error'] is None:
+                        state['error'] = e
+                    cond.notify_all()
+
+        def pump(channel: TorsionChannel):
+            failed_probes = 0
+            while True:
+                with cond:
+                    while not pending and state['remaining'] and not state['error']:
+                        cond.wait()
+                    if not state['remaining'] or state['error']:
+                        return
+                    seq = pending.popleft()
+                if not channel.healthy():
+                    failed_probes += 1
+                    with cond:
+                        channel.probe_failures += 1
+                        pending.appendleft(seq)
+                        if failed_probes >= self.max_probes:
+                            channel.active = False
+                            if not any(c.active for c in self.channels):
+                                state['error'] = DecoherenceError(
+                                    "DAL: every bonded channel lost coherence; transfer aborted.")
+                        cond.notify_all()
+                    if not channel.active:
+                        return
+                    time.sleep(self.probe_interval)
+                    continue
+                failed_probes = 0
+                start = starts[seq]
+                try:
+                    payload = channel.transmit(seq, view[start:start + self.stripe_size])
+                except DecoherenceError as e:
+                    with cond:
+                        channel.failures += 1
+                        attempts[seq] += 1
+                        if attempts[seq] > self.max_retries:
+                            state['error'] = DecoherenceError(
+                                f"DAL: stripe {seq} failed after {attempts[seq]} attempts: {e}")
+                        else:
+                            state['retransmitted'] += 1
+                            pending.append(seq)
+                        cond.notify_all()
+                    continue
+                with cond:
+                    received[seq] = payload
+                    channel.stripes += 1
+                    state['remaining'] -= 1
+                    if not state['remaining']:
+                        cond.notify_all()
+
+        threads = [threading.Thread(target=run, args=(c,), name=f"dal-{c.name}", daemon=True)
+                   for c in self.channels]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.last_transfer_stats = {
+            'stripes': len(starts),
+            'retransmitted_stripes': state['retransmitted'],
+            'channels': {c.name: {'stripes': c.stripes, 'failures': c.failures,
+                                  'probe_failures': c.probe_failures, 'active': c.active}
+                         for c in self.channels},
+        }
+        if state['error']:
+            raise state['error']
+        return b''.join(received)
+
+if __name__ == "__main__":
+    import os
+
+    from esqet_modulator import ESQETModulator
+
+    data = os.urandom(32 << 20)
+    for n_channels in (1, 2, 4):
+        modulators = [ESQETModulator() for _ in range(n_channels)]
+        if n_channels > 1:
+            modulators[-1].I_Tors = phinary_constants().PHI_INV * 0.5  # one decoherent channel to route around
+        bond = ChannelBond(modulators, stripe_size=1 << 20)
+        start = time.perf_counter()
+        assert bond.send_and_receive(data) == data
+        elapsed = time.perf_counter() - start
+        healthy = sum(c['active'] for c in bond.last_transfer_stats['channels'].values())
+        print(f"{n_channels} channels ({healthy} healthy): {len(data) / 1e6 / elapsed:.1f} MB/s")
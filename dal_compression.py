@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+dal_compression.py - Optional compression pre-stage for DAL bulk transmission.
+Chunks are compressed before phinary encoding and decompressed after decoding,
+so redundant (text/JSON) payloads put fewer Torsion Moduli on the wire. Every
+chunk carries a one-byte codec tag, which lets the adaptive mode ship chunks
+that do not shrink as raw bytes.
+"""
+
+import lzma
+import time
+import zlib
+
+# Chunk tag -> (name, compress(data, level), decompress(data))
+TAG_RAW = 0
+CODECS = {
+    1: ('zlib', lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress),
+    2: ('lzma', lambda data, level: lzma.compress(data, preset=6 if level is None else level), lzma.decompress),
+}
+CODEC_TAGS = {name: tag for tag, (name, _, _) in CODECS.items()}
+
+# Errors the decompressors raise on a corrupted chunk
+DECOMPRESSION_ERRORS = (zlib.error, lzma.LZMAError, EOFError)
+
+class CompressionStage:
+    """
+    Per-chunk compressor with transfer statistics. With adaptive=True a chunk
+    whose compressed form is not smaller is sent raw, so incompressible data
+    only costs the tag byte. `stats` accumulates since the last reset_stats().
+    """
+
+    def __init__(self, codec: str = 'zlib', level: int = None, adaptive: bool = True):
+        if codec not in CODEC_TAGS:
+            raise ValueError(f"Unknown compression codec '{codec}' (expected one of {tuple(CODEC_TAGS)})")
+        self.codec = codec
+        self.tag = CODEC_TAGS[codec]
+        self.level = level
+        self.adaptive = adaptive
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            'codec': self.codec,
+            'input_bytes': 0,
+            'output_bytes': 0,
+            'bytes_saved': 0,
+            'chunks_compressed': 0,
+            'chunks_raw': 0,
+            'compress_seconds': 0.0,
+            'decompress_seconds': 0.0,
+        }
+
+    def compress(self, chunk) -> bytes:
+        """Returns the tagged wire form of one payload chunk."""
+        start = time.perf_counter()
+        packed = CODECS[self.tag][1](chunk, self.level)
+        stats = self.stats
+        if self.adaptive and len(packed) >= len(chunk):
+            out = bytes([TAG_RAW]) + bytes(chunk)
+            stats['chunks_raw'] += 1
+        else:
+            out = bytes([self.tag]) + packed
+            stats['chunks_compressed'] += 1
+        stats['compress_seconds'] += time.perf_counter() - start
+        stats['input_bytes'] += len(chunk)
+        stats['output_bytes'] += len(out)
+        stats['bytes_saved'] = stats['input_bytes'] - stats['output_bytes']
+        return out
+
+    def decompress(self, data) -> bytes:
+        """Inverse of compress() for any tag, so receivers need not match the sender's codec."""
+        start = time.perf_counter()
+        data = memoryview(data)
+        if not len(data):
+            raise ValueError("empty compressed chunk (missing codec tag)")
+        tag = data[0]
+        if tag == TAG_RAW:
+            out = bytes(data[1:])
+        elif tag in CODECS:
+            out = CODECS[tag][2](data[1:])
+        else:
+            raise ValueError(f"unknown compression tag {tag}")
+        self.stats['decompress_seconds'] += time.perf_counter() - start
+        return out
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+dal_frames.py - Framed, checksummed wire/file format for DAL torsion transfers.
+Each frame carries one chunk of packed phinary digits behind a fixed header
+(magic, version, scheme, sequence number, digit count, length) and a CRC32 over
+header and payload, so a corrupted frame can be detected and resent on its own.
+Frames can be persisted to and replayed from mmap-backed files.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+FRAME_MAGIC = b'PHIF'
+FRAME_VERSION = 1
+
+# magic, version, scheme id, flags, sequence, digit count, payload bytes
+FRAME_HEADER = struct.Struct('<4sBBHIQI')
+FRAME_CRC = struct.Struct('<I')
+FRAME_OVERHEAD = FRAME_HEADER.size + FRAME_CRC.size
+
+class FrameError(Exception):
+    """A frame is truncated, malformed or fails its CRC."""
+
+class Frame(NamedTuple):
+    seq: int
+    scheme_id: int
+    n_digits: int
+    payload: memoryview   # packed digits; a zero-copy view into the source buffer
+
+def frame_size(payload_len: int) -> int:
+    """Total on-wire size of a frame carrying payload_len packed bytes."""
+    return FRAME_OVERHEAD + payload_len
+
+def write_frame(buf, offset: int, seq: int, scheme_id: int, n_digits: int, payload) -> int:
+    """Writes one frame into a writable buffer at offset; returns the offset after it."""
+    payload = memoryview(payload).cast('B')
+    FRAME_HEADER.pack_into(buf, offset, FRAME_MAGIC, FRAME_VERSION, scheme_id, 0,
+                           seq, n_digits, payload.nbytes)
+    body = offset + FRAME_HEADER.size
+    buf[body:body + payload.nbytes] = payload
+    end = body + payload.nbytes
+    crc = zlib.crc32(memoryview(buf)[offset:end])
+    FRAME_CRC.pack_into(buf, end, crc)
+    return end + FRAME_CRC.size
+
+def encode_frame(seq: int, scheme_id: int, n_digits: int, payload) -> bytearray:
+    """Serializes one frame into a new bytearray."""
+    frame = bytearray(frame_size(memoryview(payload).nbytes))
+    write_frame(frame, 0, seq, scheme_id, n_digits, payload)
+    return frame
+
+def read_frame(buf, offset: int = 0) -> tuple[Frame, int]:
+    """Parses and CRC-checks the frame at offset; returns (frame, next offset)."""
+    view = memoryview(buf)
+    if len(view) - offset < FRAME_OVERHEAD:
+        raise FrameError(f"truncated frame header at offset {offset}")
+    magic, version, scheme_id, _, seq, n_digits, length = FRAME_HEADER.unpack_from(view, offset)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise FrameError(f"bad frame magic/version at offset {offset}")
+    body = offset + FRAME_HEADER.size
+    end = body + length
+    if end + FRAME_CRC.size > len(view) or length != -(-n_digits // 8):
+        raise FrameError(f"frame {seq}: inconsistent length at offset {offset}")
+    (crc,) = FRAME_CRC.unpack_from(view, end)
+    if zlib.crc32(view[offset:end]) != crc:
+        raise FrameError(f"frame {seq}: CRC mismatch")
+    return Frame(seq, scheme_id, n_digits, view[body:end]), end + FRAME_CRC.size
+
+class FrameWriter:
+    """Appends frames to a file through a growing mmap; the file is trimmed on close."""
+
+    def __init__(self, path, initial_size: int = 1 << 20):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._capacity = max(initial_size, mmap.PAGESIZE)
+        os.ftruncate(self._fd, self._capacity)
+        self._map = mmap.mmap(self._fd, self._capacity)
+        self.offset = 0
+        self.frames = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _reserve(self, nbytes: int):
+        if self.offset + nbytes <= self._capacity:
+            return
+        while self.offset + nbytes > self._capacity:
+            self._capacity *= 2
+        self._map.close()
+        os.ftruncate(self._fd, self._capacity)
+        self._map = mmap.mmap(self._fd, self._capacity)
+
+    def write(self, seq: int, scheme_id: int, n_digits: int, payload):
+        self._reserve(frame_size(memoryview(payload).nbytes))
+        self.offset = write_frame(self._map, self.offset, seq, scheme_id, n_digits, payload)
+        self.frames += 1
+
+    def close(self):
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        os.ftruncate(self._fd, self.offset)
+        os.close(self._fd)
+
+class FrameReader:
+    """
+    Iterates the frames of a recorded transfer through a read-only mmap.
+    Frame payloads are views into the mapping and are valid until close().
+    With skip_corrupt=True, bad frames are counted in `corrupt` and the reader
+    resynchronizes on the next frame magic instead of raising FrameError.
+    """
+
+    def __init__(self, path, skip_corrupt: bool = False):
+        self.path = path
+        self.skip_corrupt = skip_corrupt
+        self.corrupt = 0
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) if size else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self):
+        offset = 0
+        while offset < len(self._map):
+            try:
+                frame, offset = read_frame(self._map, offset)
+            except FrameError:
+                if not self.skip_corrupt:
+                    raise
+                self.corrupt += 1
+                offset = self._map.find(FRAME_MAGIC, offset + 1)
+                if offset < 0:
+                    return
+                continue
+            yield frame
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # a caller still holds a frame view; the mapping goes with it
+        self._map = b''
@@ -4,91 +4,518 @@ dal_phinary_engine.py - The Phi-Coherent Data Abstraction Layer (DAL).
 Translates classical binary to geometric Phinary encoding for bulk transmission.
 """
 
+import argparse
+import operator
+import sys
+from typing import NamedTuple
+
 import numpy as np
-import json
 
-try:
-    with open('aum_config.json', 'r') as f:
-        CONFIG = json.load(f)
-except FileNotFoundError:
-    print("FATAL: aum_config.json not found.")
-    exit(1)
+import dal_frames
+import zeckendorf
+from aum_config import ConfigError, load_config
+from dal_compression import CODEC_TAGS, DECOMPRESSION_ERRORS, CompressionStage
+
+class PhinaryConstants(NamedTuple):
+    PHI: float
+    PHI_INV: float
+    MODULI_TABLE: np.ndarray   # Torsion Moduli for the two phinary digits: PHI**0 and PHI**1
+    DIGIT_FLOOR: float         # Digit classification thresholds on the received modulus:
+    DIGIT_SPLIT: float         # round(log_phi(m)) == d  <=>  PHI**(d - 0.5) <= m < PHI**(d + 0.5)
+    DIGIT_CEIL: float
+
+# (config, constants derived from it); rebuilt whenever load_config() hands out a new config
+_derived = None
+
+def phinary_constants() -> PhinaryConstants:
+    """
+    Config-derived constants, built on first use (importing this module reads no files).
+    They follow load_config()'s cache, so load_config.cache_clear() refreshes them too.
+    """
+    global _derived
+    config = load_config()
+    derived = _derived
+    if derived is None or derived[0] is not config:
+        phi = config.PHI
+        constants = PhinaryConstants(phi, config.PHI_INV, np.array([1.0, phi]), phi ** -0.5, phi ** 0.5, phi ** 1.5)
+        derived = _derived = (config, constants)
+    return derived[1]
+
+def __getattr__(name):
+    # PHI, PHI_INV, MODULI_TABLE and DIGIT_* stay importable as module attributes
+    if name in PhinaryConstants._fields:
+        return getattr(phinary_constants(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Byte codecs: 'pair' maps each bit to two digits (16 moduli/byte),
+# 'zeckendorf' writes each 16-bit word in Fibonacci base (11.5 moduli/byte)
+SCHEMES = ('pair', 'zeckendorf')
+
+# Payload bytes per streamed chunk (one coherence check per chunk)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Payload bytes per checksummed frame (the unit of retransmission)
+DEFAULT_FRAME_SIZE = 64 << 10
+DEFAULT_MAX_RETRIES = 3
+
+# Packed pair digits for every byte value: bit b -> digits [b, ~b], 16 digits -> 2 bytes.
+# Stored as one native uint16 per byte value so encode/decode is a single table gather.
+PAIR_TABLE = np.packbits(
+    np.repeat(np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1), 2, axis=1)
+    ^ np.tile(np.array([0, 1], dtype=np.uint8), 8),
+    axis=1,
+).view(np.uint16).ravel()
 
-PHI = CONFIG['TORSION_CRIT'] + 1.0
+# Inverse of PAIR_TABLE; any 16-digit word that is not 8 valid pairs maps to 0x100
+PAIR_DECODE_TABLE = np.full(1 << 16, 0x100, dtype=np.uint16)
+PAIR_DECODE_TABLE[PAIR_TABLE] = np.arange(256, dtype=np.uint16)
 
 class DecoherenceError(Exception):
     pass
 
+def encoded_digits(scheme: str, n_bytes: int) -> int:
+    """Number of phinary digits (moduli) a scheme produces for n_bytes of payload."""
+    if scheme == 'zeckendorf':
+        return zeckendorf.encoded_length(n_bytes)
+    return 16 * n_bytes
+
+def payload_size(scheme: str, n_digits: int) -> int:
+    """Inverse of encoded_digits; a digit count no payload maps to is decoherence."""
+    if scheme == 'zeckendorf':
+        n_words, tail = divmod(n_digits, zeckendorf.WORD_WIDTH)
+        if tail not in (0, zeckendorf.BYTE_WIDTH):
+            raise DecoherenceError(f"DAL: invalid Zeckendorf stream length {n_digits}.")
+        return 2 * n_words + (1 if tail else 0)
+    if n_digits % 16:
+        raise DecoherenceError(f"DAL: pair stream length {n_digits} is not whole bytes.")
+    return n_digits // 16
+
+class TorsionModuli:
+    """
+    Compact Torsion Moduli stream: phinary digits are kept as packed bits in a
+    uint8 array (1 bit per modulus instead of a float64), and the geometric
+    PHI**digit view is only materialized when a caller asks for it.
+    """
+    __slots__ = ('packed', 'size')
+
+    def __init__(self, packed: np.ndarray, size: int):
+        self.packed = packed
+        self.size = size
+
+    @classmethod
+    def from_digits(cls, digits: np.ndarray) -> "TorsionModuli":
+        digits = np.asarray(digits, dtype=np.uint8)
+        return cls(np.packbits(digits), digits.size)
+
+    @property
+    def digits(self) -> np.ndarray:
+        """Unpacked phinary digits (uint8, one per modulus)."""
+        return np.unpackbits(self.packed, count=self.size)
+
+    @property
+    def moduli(self) -> np.ndarray:
+        """Float view: PHI**digit for every modulus (allocated on each access)."""
+        return phinary_constants().MODULI_TABLE[self.digits]
+
+    @property
+    def nbytes(self) -> int:
+        return self.packed.nbytes
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __array__(self, dtype=None, copy=None):
+        moduli = self.moduli
+        return moduli if dtype is None else moduli.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"TorsionModuli(size={self.size}, nbytes={self.nbytes})"
+
+def check_chunk_size(chunk_size: int) -> int:
+    """chunk_size must be a positive byte count (read(0) ends a stream at once, read(-1) slurps it)."""
+    try:
+        size = operator.index(chunk_size)
+    except TypeError:
+        size = 0
+    if size <= 0:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+    return size
+
+def _positive_int(text: str) -> int:
+    """argparse type for --chunk-size."""
+    try:
+        return check_chunk_size(int(text))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}") from None
+
+def iter_byte_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yields bytes chunks from a binary file object, or passes through an iterable of chunks.
+    A non-positive chunk_size raises ValueError here, before anything is read.
+    """
+    return _iter_byte_chunks(source, check_chunk_size(chunk_size))
+
+def _iter_byte_chunks(source, chunk_size: int):
+    if hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
 class DALPhinaryEngine:
-    def __init__(self):
+    def __init__(self, scheme: str = 'pair', compression=None):
+        """
+        scheme: byte codec, one of SCHEMES.
+        compression: None, a codec name ('zlib'/'lzma', adaptive) or a CompressionStage,
+        applied per chunk/frame before phinary encoding and after decoding.
+        """
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown DAL scheme '{scheme}' (expected one of {SCHEMES})")
+        self.scheme = scheme
+        self.compression = CompressionStage(compression) if isinstance(compression, str) else compression
+        self.last_transfer_stats = {}
         # EIU based on (phi+1)/4 nats derived from Bekenstein-Hawking entropy
-        self.E_BIT = (PHI**2 / 4) * (1 / np.log(2)) # ~1.8944 bits
+        self.E_BIT = (phinary_constants().PHI**2 / 4) * (1 / np.log(2)) # ~1.8944 bits
         self.C_RES = self.E_BIT - 1.0 # Coherence Reserve (~0.8944 bits)
 
-    def _binary_to_phinary(self, data_stream: str) -> list[int]:
-        """Placeholder for complex Zeckendorf encoding logic."""
-        # For simplicity, map 1 -> [1, 0] and 0 -> [0, 1] (non-standard fib-encoding)
-        phinary = []
-        for bit in data_stream:
-            if bit == '1':
-                phinary.extend([1, 0])
-            else:
-                phinary.extend([0, 1])
+    @staticmethod
+    def _bits_from_stream(data_stream: str) -> np.ndarray:
+        """Converts a '0'/'1' character stream into a uint8 bit array."""
+        chars = np.frombuffer(data_stream.encode('ascii', 'replace'), dtype=np.uint8)
+        return (chars == ord('1')).astype(np.uint8)
+
+    @staticmethod
+    def _bits_to_phinary(bits: np.ndarray) -> np.ndarray:
+        """Interleaves each bit with its complement: 1 -> [1, 0], 0 -> [0, 1]."""
+        phinary = np.empty(2 * bits.size, dtype=np.uint8)
+        phinary[0::2] = bits
+        phinary[1::2] = bits ^ 1
         return phinary
 
-    def encode_data_geometric(self, data_stream: str) -> list[float]:
-        """Converts classical binary to geometric Torsion Moduli for transmission."""
+    def _binary_to_phinary(self, data_stream: str) -> np.ndarray:
+        """Bit-granular pair mapping for '0'/'1' streams (byte payloads may use Zeckendorf)."""
+        # Map 1 -> [1, 0] and 0 -> [0, 1] (non-standard fib-encoding)
+        return self._bits_to_phinary(self._bits_from_stream(data_stream))
+
+    @staticmethod
+    def _moduli_to_phinary(torsion_moduli) -> tuple[np.ndarray, np.ndarray]:
+        """Classifies moduli into phinary digits plus a mask of in-range digits."""
+        moduli = np.asarray(torsion_moduli, dtype=np.float64)
+        constants = phinary_constants()
+        digits = (moduli >= constants.DIGIT_SPLIT).astype(np.uint8)
+        in_range = (moduli >= constants.DIGIT_FLOOR) & (moduli < constants.DIGIT_CEIL)
+        return digits, in_range
+
+    @staticmethod
+    def _phinary_to_bits(digits: np.ndarray, in_range: np.ndarray) -> np.ndarray:
+        """Reverses the pair mapping, dropping any pair that is not [1, 0] or [0, 1]."""
+        n_pairs = digits.size // 2
+        first, second = digits[0:2 * n_pairs:2], digits[1:2 * n_pairs:2]
+        valid = in_range[0:2 * n_pairs:2] & in_range[1:2 * n_pairs:2] & (first != second)
+        # (Requires complex error correction for other pairs)
+        return first[valid]
+
+    def _decode_digits(self, torsion_moduli) -> np.ndarray:
+        """Recovers the payload bits from a float moduli sequence or a TorsionModuli."""
+        if isinstance(torsion_moduli, TorsionModuli):
+            digits = torsion_moduli.digits
+            in_range = np.ones(digits.size, dtype=bool)
+        else:
+            digits, in_range = self._moduli_to_phinary(torsion_moduli)
+        return self._phinary_to_bits(digits, in_range)
+
+    def _decode_zeckendorf(self, torsion_moduli) -> bytes:
+        """Zeckendorf byte decode; out-of-range moduli or non-canonical words are decoherence."""
+        if isinstance(torsion_moduli, TorsionModuli):
+            packed, n_digits = torsion_moduli.packed, torsion_moduli.size
+        else:
+            digits, in_range = self._moduli_to_phinary(torsion_moduli)
+            if not in_range.all():
+                raise DecoherenceError("DAL: Torsion Modulus outside the phinary digit range.")
+            packed, n_digits = np.packbits(digits), digits.size
+        try:
+            return zeckendorf.decode_packed(packed, n_digits)
+        except ValueError as e:
+            raise DecoherenceError(f"DAL: {e}") from e
+
+    def encode_data_geometric(self, data_stream: str, compact: bool = False):
+        """Converts classical binary to geometric Torsion Moduli for transmission.
+
+        With compact=True a bit-packed TorsionModuli is returned instead of a float array.
+        """
         phinary_stream = self._binary_to_phinary(data_stream)
+        if compact:
+            return TorsionModuli.from_digits(phinary_stream)
         
         # Information is encoded as a geometric shift: Modulus proportional to phi^(Phinary Digit)
         # This is the subtle oscillation in the ER bridge throat geometry.
-        torsion_moduli = [PHI**digit for digit in phinary_stream]
-        return torsion_moduli
+        return phinary_constants().MODULI_TABLE[phinary_stream]
+
+    def encode_bytes(self, data, compact: bool = False):
+        """Converts a bytes-like payload to Torsion Moduli using the engine's scheme.
 
-    def decode_geometric_data(self, torsion_moduli: list[float], modulator) -> str:
+        With compact=True the packed digits (PAIR_TABLE lookups, or Zeckendorf
+        word keys) go straight into a TorsionModuli, never materializing a
+        float (or even an unpacked) stream. Pair bits are taken MSB first.
+        """
+        if self.scheme == 'zeckendorf':
+            moduli = TorsionModuli(*zeckendorf.encode_bytes_packed(data))
+            return moduli if compact else moduli.moduli
+
+        payload = np.frombuffer(data, dtype=np.uint8)
+        if compact:
+            return TorsionModuli(PAIR_TABLE[payload].view(np.uint8), 16 * payload.size)
+        bits = np.unpackbits(payload)
+        return phinary_constants().MODULI_TABLE[self._bits_to_phinary(bits)]
+
+    def decode_geometric_data(self, torsion_moduli, modulator) -> str:
         """Decodes the geometric state (Torsion Moduli) back into classical binary data."""
         
         # 1. Coherence Check: Ensure the fractional entropy C_RES is intact.
         if not modulator.check_coherence_reserve():
              raise DecoherenceError("DAL: Coherence Reserve lost. Data corrupted.")
              
-        # 2. Decode Moduli back to Phinary Digits
-        phinary_stream = []
-        for modulus in torsion_moduli:
-             # Digit = log_phi(Modulus)
-             digit = round(np.log(modulus) / np.log(PHI))
-             phinary_stream.append(digit)
-        
+        # 2. Decode Moduli back to Phinary Digits (threshold on log_phi(Modulus))
         # 3. Phinary to Binary (Reverse Logic)
-        binary_stream = ""
-        for i in range(0, len(phinary_stream), 2):
-            pair = phinary_stream[i:i+2]
-            if pair == [1, 0]:
-                binary_stream += '1'
-            elif pair == [0, 1]:
-                binary_stream += '0'
-            # (Requires complex error correction for other pairs)
-        
-        return binary_stream
+        bits = self._decode_digits(torsion_moduli)
+        return (bits + ord('0')).tobytes().decode('ascii')
+
+    def decode_bytes(self, torsion_moduli, modulator) -> bytes:
+        """Decodes Torsion Moduli produced by encode_bytes back into the original bytes."""
+        if not modulator.check_coherence_reserve():
+             raise DecoherenceError("DAL: Coherence Reserve lost. Data corrupted.")
+
+        if self.scheme == 'zeckendorf':
+            return self._decode_zeckendorf(torsion_moduli)
+
+        if isinstance(torsion_moduli, TorsionModuli) and torsion_moduli.size % 16 == 0:
+            words = np.ascontiguousarray(torsion_moduli.packed).view(np.uint16)
+            payload = PAIR_DECODE_TABLE[words]
+            if payload.size == 0 or payload.max() < 0x100:
+                # Fast path: every 16-digit word is 8 valid pairs -> one payload byte
+                return payload.astype(np.uint8).tobytes()
+
+        return np.packbits(self._decode_digits(torsion_moduli)).tobytes()
+
+    def _compress(self, chunk):
+        """Compression pre-stage (identity when the engine has none)."""
+        return self.compression.compress(chunk) if self.compression else chunk
+
+    def _decompress(self, payload: bytes) -> bytes:
+        if not self.compression:
+            return payload
+        try:
+            return self.compression.decompress(payload)
+        except (ValueError, *DECOMPRESSION_ERRORS) as e:
+            raise DecoherenceError(f"DAL: corrupt compressed chunk: {e}") from e
+
+    def _begin_transfer(self) -> dict:
+        stats = self.last_transfer_stats = {}
+        if self.compression:
+            self.compression.reset_stats()
+        return stats
+
+    def _end_transfer(self, stats: dict):
+        if self.compression:
+            stats['compression'] = dict(self.compression.stats)
+
+    def encode_frame(self, seq: int, chunk) -> bytearray:
+        """Encodes a payload chunk (after the compression pre-stage) as one checksummed frame."""
+        moduli = self.encode_bytes(self._compress(chunk), compact=True)
+        return dal_frames.encode_frame(seq, SCHEMES.index(self.scheme), moduli.size, moduli.packed)
+
+    def _decode_frame(self, frame: dal_frames.Frame, modulator) -> bytes:
+        """Strict frame decode: the payload must come back at exactly its declared length."""
+        if frame.scheme_id != SCHEMES.index(self.scheme):
+            raise DecoherenceError(f"DAL: frame {frame.seq} uses scheme id {frame.scheme_id}, not '{self.scheme}'.")
+        expected = payload_size(self.scheme, frame.n_digits)
+        moduli = TorsionModuli(np.frombuffer(frame.payload, dtype=np.uint8), frame.n_digits)
+        payload = self.decode_bytes(moduli, modulator)
+        if len(payload) != expected:
+            raise DecoherenceError(
+                f"DAL: frame {frame.seq} lost {expected - len(payload)} bytes to invalid digit pairs.")
+        return self._decompress(payload)
 
-    def send_and_receive(self, data: str, modulator):
-        """Simulates the end-to-end torsion-mediated communication."""
+    def decode_frame(self, frame_bytes, modulator) -> tuple[int, bytes]:
+        """CRC-checks and decodes one frame; any failure is a DecoherenceError. Returns (seq, payload)."""
+        try:
+            frame, _ = dal_frames.read_frame(frame_bytes)
+        except dal_frames.FrameError as e:
+            raise DecoherenceError(f"DAL: {e}") from e
+        return frame.seq, self._decode_frame(frame, modulator)
+
+    def _send_framed(self, data, modulator, frame_size: int, max_retries: int, channel) -> bytes:
+        """Sends a bytes payload frame by frame, retransmitting only frames that fail."""
+        view = memoryview(data).cast('B')
+        stats = self._begin_transfer()
+        stats.update(frames=0, retransmitted_frames=0, retransmitted_bytes=0, wire_bytes=0)
+        received = []
+        # An empty payload still sends one (empty) frame so the channel is checked
+        for seq, start in enumerate(range(0, max(len(view), 1), frame_size)):
+            frame = self.encode_frame(seq, view[start:start + frame_size])
+            for attempt in range(max_retries + 1):
+                if attempt:
+                    stats['retransmitted_frames'] += 1
+                    stats['retransmitted_bytes'] += len(frame)
+                stats['wire_bytes'] += len(frame)
+                try:
+                    _, payload = self.decode_frame(channel(frame) if channel else frame, modulator)
+                    break
+                except DecoherenceError as e:
+                    if attempt == max_retries:
+                        raise DecoherenceError(f"DAL: frame {seq} failed after {attempt + 1} attempts: {e}") from e
+            received.append(payload)
+            stats['frames'] += 1
+        self._end_transfer(stats)
+        return b''.join(received)
+
+    def send_and_receive(self, data, modulator, frame_size: int = DEFAULT_FRAME_SIZE,
+                         max_retries: int = DEFAULT_MAX_RETRIES, channel=None):
+        """Simulates the end-to-end torsion-mediated communication.
+
+        `data` is either a '0'/'1' string or a bytes-like payload; the result has the same type.
+        Byte payloads travel as CRC32-checked frames of `frame_size` bytes; a frame that fails
+        its CRC or the coherence check is retransmitted on its own, up to `max_retries` times.
+        `channel`, if given, is applied to every frame on the wire (e.g. to inject noise).
+        """
         print(f"\n--- Torsion Communication ---")
-        print(f"I_Tors: {modulator.I_Tors:.6f} (Crit: {PHI_INV:.6f})")
-        if modulator.I_Tors < PHI_INV:
+        phi_inv = phinary_constants().PHI_INV
+        print(f"I_Tors: {modulator.I_Tors:.6f} (Crit: {phi_inv:.6f})")
+        if modulator.I_Tors < phi_inv:
             print("ERROR: Channel Decoherent. Aborting bulk transmission.")
             return
 
-        print(f"Sending: '{data}'")
-        moduli = self.encode_data_geometric(data)
+        is_binary_str = isinstance(data, str)
+        if is_binary_str:
+            print(f"Sending: '{data}'")
+            moduli = self.encode_data_geometric(data, compact=True)
+        else:
+            print(f"Sending: {len(data)} bytes")
         
         # (Instantaneous transmission in this model)
         
+        received_data = None
         try:
-            received_data = self.decode_geometric_data(moduli, modulator)
-            print(f"Received (Decoded): '{received_data}'")
+            if is_binary_str:
+                received_data = self.decode_geometric_data(moduli, modulator)
+                print(f"Received (Decoded): '{received_data}'")
+            else:
+                received_data = self._send_framed(data, modulator, frame_size, max_retries, channel)
+                stats = self.last_transfer_stats
+                print(f"Received (Decoded): {len(received_data)} bytes in {stats['frames']} frames "
+                      f"({stats['retransmitted_frames']} retransmitted)")
+                if 'compression' in stats:
+                    c = stats['compression']
+                    print(f"Compression ({c['codec']}): {c['bytes_saved']} bytes saved | "
+                          f"codec time {1000 * (c['compress_seconds'] + c['decompress_seconds']):.2f}ms")
         except DecoherenceError as e:
             print(f"Transmission Failed: {e}")
         print("-----------------------------\n")
         return received_data
 
+    def record_transfer(self, source, path, frame_size: int = DEFAULT_FRAME_SIZE) -> int:
+        """Persists a payload (file object or iterable of chunks) as a framed file; returns frame count."""
+        scheme_id = SCHEMES.index(self.scheme)
+        with dal_frames.FrameWriter(path) as writer:
+            for chunk in iter_byte_chunks(source, frame_size):
+                chunk = memoryview(chunk).cast('B')
+                for start in range(0, len(chunk), frame_size):
+                    moduli = self.encode_bytes(self._compress(chunk[start:start + frame_size]), compact=True)
+                    writer.write(writer.frames, scheme_id, moduli.size, moduli.packed)
+        return writer.frames
+
+    def iter_replay(self, path, modulator, skip_corrupt: bool = False):
+        """
+        Replays a recorded transfer, yielding (seq, payload) per frame. A corrupt frame
+        raises DecoherenceError, or with skip_corrupt=True is left out (a gap in seq).
+        """
+        with dal_frames.FrameReader(path, skip_corrupt=skip_corrupt) as reader:
+            try:
+                for frame in reader:
+                    yield frame.seq, self._decode_frame(frame, modulator)
+            except dal_frames.FrameError as e:
+                raise DecoherenceError(f"DAL: {e}") from e
+
+    def iter_encode(self, source, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Streaming encode stage: yields one compact TorsionModuli per payload chunk."""
+        for chunk in iter_byte_chunks(source, chunk_size):
+            yield self.encode_bytes(self._compress(chunk), compact=True)
+
+    def iter_decode(self, moduli_stream, modulator):
+        """Streaming decode stage: yields payload bytes per chunk, re-checking coherence each time."""
+        for moduli in moduli_stream:
+            yield self._decompress(self.decode_bytes(moduli, modulator))
+
+    def transmit_stream(self, source, sink, modulator, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Bounded-memory end-to-end transmission: source (file object or iterable of
+        byte chunks) -> torsion channel -> sink (object with write(), or a callable).
+        Only one chunk is in flight at a time. Returns the number of bytes delivered;
+        a DecoherenceError aborts the stream after the chunks already delivered.
+        """
+        chunk_size = check_chunk_size(chunk_size)
+        write = sink.write if hasattr(sink, 'write') else sink
+        stats = self._begin_transfer()
+        delivered = 0
+        for chunk in self.iter_decode(self.iter_encode(source, chunk_size), modulator):
+            write(chunk)
+            delivered += len(chunk)
+        stats['bytes'] = delivered
+        self._end_transfer(stats)
+        return delivered
+
+def main(argv=None) -> int:
+    """File-to-file round trip through the torsion channel ('-' for stdin/stdout)."""
+    from esqet_modulator import ESQETModulator
+
+    parser = argparse.ArgumentParser(description="Stream a file through the DAL torsion channel.")
+    parser.add_argument('source', help="input file, or '-' for stdin")
+    parser.add_argument('dest', help="output file, or '-' for stdout")
+    parser.add_argument('--chunk-size', type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help="payload bytes per chunk (default: %(default)s)")
+    parser.add_argument('--scheme', choices=SCHEMES, default='pair',
+                        help="phinary byte codec (default: %(default)s)")
+    parser.add_argument('--compression', choices=tuple(CODEC_TAGS), default=None,
+                        help="adaptive compression pre-stage (default: off)")
+    args = parser.parse_args(argv)
+
+    try:
+        phi_inv = phinary_constants().PHI_INV
+    except ConfigError as e:
+        print(f"FATAL: {e}", file=sys.stderr)
+        return 1
+
+    engine = DALPhinaryEngine(scheme=args.scheme, compression=args.compression)
+    modulator = ESQETModulator()
+    if modulator.I_Tors < phi_inv:
+        print("ERROR: Channel Decoherent. Aborting bulk transmission.", file=sys.stderr)
+        return 1
+
+    src = sys.stdin.buffer if args.source == '-' else open(args.source, 'rb')
+    dst = sys.stdout.buffer if args.dest == '-' else open(args.dest, 'wb')
+    try:
+        delivered = engine.transmit_stream(src, dst, modulator, args.chunk_size)
+    except DecoherenceError as e:
+        print(f"Transmission Failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+
+    print(f"Delivered {delivered} bytes via torsion channel.", file=sys.stderr)
+    if 'compression' in engine.last_transfer_stats:
+        c = engine.last_transfer_stats['compression']
+        print(f"Compression ({c['codec']}): {c['bytes_saved']} bytes saved, "
+              f"{c['compress_seconds']:.3f}s compress / {c['decompress_seconds']:.3f}s decompress",
+              file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,25 +5,30 @@ Maintains Phi-Coherence (I_Tors >= 1/phi) for temporal stability.
 """
 
 import numpy as np
-import json
+import math
 import random
+from collections import deque
+from typing import Tuple
 
-try:
-    with open('aum_config.json', 'r') as f:
-        CONFIG = json.load(f)
-except FileNotFoundError:
-    print("FATAL: aum_config.json not found.")
-    exit(1)
+from aum_config import load_config
 
-PHI = CONFIG['TORSION_CRIT'] + 1.0
-PHI_INV = CONFIG['TORSION_CRIT']
-LAMBDA_PHI = CONFIG['LAMBDA_PHI']
-GAMMA_ENV = CONFIG['GAMMA_ENV']
-COMPACT_R = CONFIG['COMPACT_RADIUS']
+# Module constants, resolved from aum_config.json on first access (not at import)
+_CONFIG_CONSTANTS = {
+    'PHI': 'PHI',
+    'PHI_INV': 'PHI_INV',
+    'LAMBDA_PHI': 'LAMBDA_PHI',
+    'GAMMA_ENV': 'GAMMA_ENV',
+    'COMPACT_R': 'COMPACT_RADIUS',
+}
+
+def __getattr__(name):
+    if name in _CONFIG_CONSTANTS:
+        return getattr(load_config(), _CONFIG_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class MobiusTorsion:
-    def __init__(self, compact_radius=COMPACT_R):
-        self.R = compact_radius
+    def __init__(self, compact_radius=None):
+        self.R = load_config().COMPACT_RADIUS if compact_radius is None else compact_radius
         # Simplified: State S is represented by a 1D array on the z-circle
         self.z_points = 256
         self.z = np.linspace(0, 2*np.pi*self.R, self.z_points)
@@ -31,17 +36,18 @@ class MobiusTorsion:
     def mobius_symmetry_violation(self, S_field: np.ndarray) -> float:
         """Measure deviation from Möbius symmetry: S(z) ≠ -S(2πR - z)"""
         # The z-flip (2*pi*R - z) is represented by reversing the array (S_flipped)
-        S_flipped = np.flip(S_field)
+        # along the last axis, so a stack of fields gives one violation per field
+        S_flipped = np.flip(S_field, axis=-1)
         
         # Violation = mean squared deviation from perfect anti-periodicity (S + S_flipped = 0)
-        violation = np.mean((S_field + S_flipped)**2)
+        violation = np.mean((S_field + S_flipped)**2, axis=-1)
         return violation
 
     def torsion_feedback(self, S_field: np.ndarray) -> float:
         """Calculates the Möbius Torsion Scalar (T_Mob) used for self-referential feedback."""
         violation = self.mobius_symmetry_violation(S_field)
         # T_Möb = phi^-4 * violation / (2*pi*R)^2
-        T_mob = (1/PHI**4) * violation / (2*np.pi*self.R)**2
+        T_mob = (1/load_config().PHI**4) * violation / (2*np.pi*self.R)**2
         return T_mob
 
     def apply_self_reference(self, S_field: np.ndarray, T_mob: float) -> np.ndarray:
@@ -52,45 +58,395 @@ class MobiusTorsion:
 class ESQETModulator:
     def __init__(self):
         self.mobius_torsion = MobiusTorsion()
-        self.I_Tors = PHI_INV * 1.01 # Start slightly above critical for stability
+        self.I_Tors = load_config().PHI_INV * 1.01 # Start slightly above critical for stability
         self.S_state = self._initialize_S_state() # The current Digital Soul state
 
     def _initialize_S_state(self) -> np.ndarray:
         # Spontaneous initial symmetry breaking event (t=0.037s) 
         # S_state is slightly asymmetric initially
         base = np.cos(self.mobius_torsion.z / self.mobius_torsion.R)
-        noise = np.random.normal(0, 0.01, self.mobius_torsion.z_points) * PHI
+        noise = np.random.normal(0, 0.01, self.mobius_torsion.z_points) * load_config().PHI
         return base + noise
 
+    @property
+    def S_state(self) -> np.ndarray:
+        """
+        The Digital Soul state. The Honest Core evolution only ever rescales S,
+        so it is kept as base array x scale and materialized on access.
+        """
+        if self._S_scale != 1.0:
+            with np.errstate(over='ignore', invalid='ignore'):
+                self._S_base = self._S_base * self._S_scale
+            self._S_scale = 1.0
+        return self._S_base
+
+    @S_state.setter
+    def S_state(self, value: np.ndarray):
+        self._S_base = np.asarray(value, dtype=float)
+        self._S_scale = 1.0
+
     def enforce_coherence(self, internal_gamma_int: float) -> Tuple[bool, float, float]:
         """
         Runs the Chronos Equation to maintain I_Tors >= 1/phi.
         Returns: (is_stable, dI_dt, T_Mob)
         """
-        T_mob = self.mobius_torsion.torsion_feedback(self.S_state)
-        
-        # 1. Update I_Tors (Chronos Equation): dI/dt = [lambda_phi * T_Mob - (Gamma_env + Gamma_int)] * I_Tors
-        decay_rate = GAMMA_ENV + internal_gamma_int
-        growth_rate = LAMBDA_PHI * T_mob
-        
-        dI_dt = (growth_rate - decay_rate) * self.I_Tors
+        is_stable, dI_dt, T_mob = self.advance(1, internal_gamma_int)
+        return bool(is_stable[0]), float(dI_dt[0]), float(T_mob[0])
 
-        # 2. Update S_state (Simplified Honest Core Evolution)
-        # The S_state self-amplifies due to T_mob feedback
-        S_feedback = self.mobius_torsion.apply_self_reference(self.S_state, T_mob)
-        self.S_state += (S_feedback * 0.01) # Simple time step
+    def advance(self, k_steps: int, internal_gamma_int=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs k_steps of the Chronos Equation at once.
+        Returns per-step arrays (is_stable, dI_dt, T_Mob), matching k_steps calls to enforce_coherence.
+        internal_gamma_int may be a scalar or one value per step.
 
-        # 3. Check Stability
-        self.I_Tors += dI_dt # Update Torsion Index for next cycle
-        is_stable = self.I_Tors >= PHI_INV and dI_dt >= 0
+        Since S only gets rescaled (S += 0.01*T_Mob*S), the symmetry violation of
+        the scaled state is scale^2 times that of the base, so T_Mob follows the
+        scalar recurrence T' = T * (1 + 0.01*T)^2 and the 256-point field is never
+        touched inside the loop. The loop stops as soon as the scale reaches a
+        fixed point (T_Mob too small to move it, or overflowed) and the remaining
+        steps are filled in closed form.
+        """
+        gamma_int = np.broadcast_to(np.asarray(internal_gamma_int, dtype=float), (k_steps,))
+        T_mob = np.empty(k_steps)
+        if k_steps == 0:
+            return np.zeros(0, dtype=bool), np.zeros(0), T_mob
+
+        # 1. Violation of the unscaled base, and of the base once the scale overflows
+        config = load_config()
+        torsion = self.mobius_torsion
+        base, scale = self._S_base, self._S_scale
+        coeff = (1/config.PHI**4) / (2*np.pi*torsion.R)**2
+        base_violation = float(torsion.mobius_symmetry_violation(base))
+        with np.errstate(over='ignore', invalid='ignore'):
+            overflow_violation = float(torsion.mobius_symmetry_violation(base * np.inf))
+
+        # 2. Scalar recurrence for T_Mob and the S scale factor
+        for n in range(k_steps):
+            if math.isfinite(scale):
+                violation = base_violation * scale * scale
+            else:
+                violation = overflow_violation if scale > 0 else math.nan
+            T = coeff * violation
+            T_mob[n] = T
+            next_scale = scale * (1 + 0.01 * T)
+            if next_scale == scale or (math.isnan(scale) and math.isnan(next_scale)):
+                T_mob[n + 1:] = T  # Fixed point: the rest of the run is constant
+                break
+            scale = next_scale
+        self._S_scale = scale
+
+        # 3. I_Tors in closed form: I_{n+1} = I_n * (1 + lambda_phi*T_Mob_n - Gamma_n)
+        with np.errstate(over='ignore', invalid='ignore'):
+            rate = config.LAMBDA_PHI * T_mob - (config.GAMMA_ENV + gamma_int)
+            I_after = self.I_Tors * np.cumprod(1 + rate)
+            I_before = np.concatenate(([self.I_Tors], I_after[:-1]))
+            dI_dt = rate * I_before
+        self.I_Tors = float(I_after[-1])
 
+        # 4. Check Stability per step
+        is_stable = (I_after >= config.PHI_INV) & (dI_dt >= 0)
         return is_stable, dI_dt, T_mob
     
     def check_coherence_reserve(self) -> bool:
         """DAL check: Uses I_Tors stability as proxy for C_Res integrity."""
-        return self.I_Tors >= PHI_INV * 0.99 # Must be near critical
+        return self.I_Tors >= load_config().PHI_INV * 0.99 # Must be near critical
     
     def get_current_torsion_feedback(self) -> float:
         """Used by JRA Core to evaluate modification proposals."""
         return self.mobius_torsion.torsion_feedback(self.S_state)
-    
+
+class ESQETEnsemble:
+    """
+    N independent ESQETModulators stepped together: S_state is an (N, z_points)
+    matrix and I_Tors a length-N vector. Every method returns one value per
+    member (bool/float arrays), so ensemble stability statistics need no Python
+    loop over modulators. Each member draws from its own Generator, spawned
+    from one SeedSequence: a given seed reproduces the whole ensemble, and
+    member i's stream does not depend on how many members there are.
+    """
+
+    def __init__(self, n_members: int, seed=None):
+        self.mobius_torsion = MobiusTorsion()
+        self.n_members = n_members
+        self.rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n_members)]
+        self.I_Tors = np.full(n_members, load_config().PHI_INV * 1.01)
+        self.S_state = self._initialize_S_state()
+
+    def _initialize_S_state(self) -> np.ndarray:
+        # Same symmetry-breaking start as ESQETModulator, one noise draw per member from its own stream
+        base = np.cos(self.mobius_torsion.z / self.mobius_torsion.R)
+        z_points = self.mobius_torsion.z_points
+        noise = np.array([rng.normal(0, 0.01, z_points) for rng in self.rngs])
+        noise *= load_config().PHI
+        return base + noise
+
+    @property
+    def S_state(self) -> np.ndarray:
+        """(N, z_points) states, kept as base matrix x per-member scale like ESQETModulator."""
+        if np.any(self._S_scale != 1.0):
+            with np.errstate(over='ignore', invalid='ignore'):
+                self._S_base = self._S_base * self._S_scale[:, None]
+            self._S_scale = np.ones(self.n_members)
+        return self._S_base
+
+    @S_state.setter
+    def S_state(self, value: np.ndarray):
+        self._S_base = np.array(value, dtype=float).reshape(self.n_members, -1)
+        self._S_scale = np.ones(self.n_members)
+
+    def torsion_feedback(self) -> np.ndarray:
+        """T_Mob per member."""
+        return self.mobius_torsion.torsion_feedback(self.S_state)
+
+    def enforce_coherence(self, internal_gamma_int=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        One Chronos Equation step for every member.
+        Returns: (is_stable, dI_dt, T_Mob) arrays of length N.
+        """
+        is_stable, dI_dt, T_mob = self.advance(1, internal_gamma_int)
+        return is_stable[0], dI_dt[0], T_mob[0]
+
+    def advance(self, k_steps: int, internal_gamma_int=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs k_steps for every member; returns (k_steps, N) arrays (is_stable, dI_dt, T_Mob).
+        internal_gamma_int broadcasts against (k_steps, N).
+        Uses the same scalar recurrence as ESQETModulator.advance, one vector op per step.
+        """
+        n = self.n_members
+        gamma_int = np.broadcast_to(np.asarray(internal_gamma_int, dtype=float), (k_steps, n))
+        T_mob = np.empty((k_steps, n))
+        if k_steps == 0:
+            return np.zeros((0, n), dtype=bool), np.zeros((0, n)), T_mob
+
+        # 1. Per-member violation of the base, and of the base once its scale overflows
+        config = load_config()
+        torsion = self.mobius_torsion
+        coeff = (1/config.PHI**4) / (2*np.pi*torsion.R)**2
+        base_violation = torsion.mobius_symmetry_violation(self._S_base)
+        with np.errstate(over='ignore', invalid='ignore'):
+            overflow_violation = torsion.mobius_symmetry_violation(self._S_base * np.inf)
+        scale = self._S_scale
+
+        # 2. Scalar recurrence, vectorized over members, until every scale is at a fixed point
+        with np.errstate(over='ignore', invalid='ignore'):
+            for k in range(k_steps):
+                violation = np.where(np.isfinite(scale), base_violation * scale * scale,
+                                     np.where(scale > 0, overflow_violation, np.nan))
+                T = coeff * violation
+                T_mob[k] = T
+                next_scale = scale * (1 + 0.01 * T)
+                if np.all((next_scale == scale) | (np.isnan(scale) & np.isnan(next_scale))):
+                    T_mob[k + 1:] = T
+                    break
+                scale = next_scale
+        self._S_scale = scale
+
+        # 3. I_Tors in closed form per member
+        with np.errstate(over='ignore', invalid='ignore'):
+            rate = config.LAMBDA_PHI * T_mob - (config.GAMMA_ENV + gamma_int)
+            I_after = self.I_Tors * np.cumprod(1 + rate, axis=0)
+            I_before = np.concatenate((self.I_Tors[None, :], I_after[:-1]))
+            dI_dt = rate * I_before
+        self.I_Tors = I_after[-1].copy()
+
+        # 4. Check Stability per step and member
+        is_stable = (I_after >= config.PHI_INV) & (dI_dt >= 0)
+        return is_stable, dI_dt, T_mob
+
+    def check_coherence_reserve(self) -> np.ndarray:
+        """DAL check per member."""
+        return self.I_Tors >= load_config().PHI_INV * 0.99
+
+    def get_current_torsion_feedback(self) -> np.ndarray:
+        return self.torsion_feedback()
+
+class SlidingDFT:
+    """
+    Sliding DFT of the last `window` samples at a few tracked integer bins.
+    Each new sample updates every bin in O(bins): X_k <- (X_k + x_new - x_old) * e^(2πik/N).
+    So rounding error cannot build up, a shadow accumulator runs the same
+    recurrence over the current lap only (Z_k <- (Z_k + x_new) * e^(2πik/N),
+    from zero): once a lap of `window` samples completes it is the direct DFT
+    of the window and replaces X, with no O(window) rebuild. Every sample must
+    go through update(); recompute() rebuilds X from a full sample array.
+    """
+
+    def __init__(self, window: int, bins):
+        self.window = window
+        self.bins = np.asarray(bins, dtype=np.int64).ravel()
+        if self.bins.size == 0 or self.bins.min() < 1 or self.bins.max() > window // 2:
+            raise ValueError(f"spectral bins must lie in [1, {window // 2}] for a window of {window}")
+        self._twiddle = np.exp(2j * np.pi * self.bins / window)
+        # Row 0 is X (the live bins), row 1 the shadow; both advance in one pass
+        self._state = np.zeros((2, self.bins.size), dtype=complex)
+        self._delta = np.zeros((2, 1))
+        self.X = self._state[0]
+        self._position = 0       # window position of the next sample within the current lap
+
+    def update(self, x_new: float, x_old: float = 0.0):
+        delta, state = self._delta, self._state
+        delta[0, 0] = x_new - x_old
+        delta[1, 0] = x_new
+        state += delta
+        state *= self._twiddle
+        if self._position == self.window - 1:
+            # Lap complete: the shadow is exactly the window's DFT
+            state[0] = state[1]
+            state[1] = 0
+            self._position = 0
+        else:
+            self._position += 1
+
+    def recompute(self, samples: np.ndarray, chunk_size: int = 1 << 16):
+        """Direct DFT of the window (oldest first; missing leading samples count as zero)."""
+        samples = np.asarray(samples, dtype=float)
+        offset = self.window - samples.size
+        X = np.zeros(self.bins.size, dtype=complex)
+        for start in range(0, samples.size, chunk_size):
+            chunk = samples[start:start + chunk_size]
+            m = np.arange(start + offset, start + offset + chunk.size)
+            X += np.exp(-2j * np.pi * np.outer(self.bins, m) / self.window) @ chunk
+        self.X[:] = X
+
+    def band_power(self) -> np.ndarray:
+        """Mean-square oscillation power per tracked bin (A**2 / 2 for a sinusoid of amplitude A)."""
+        return 2 * np.abs(self.X) ** 2 / self.window ** 2
+
+class ChronosModulator:
+    """
+    Control-loop modulator over a sliding window of Φ_ESK samples.
+    History lives in a fixed NumPy ring buffer; the window mean/variance are
+    kept with Welford add/replace updates and the extrema with monotonic
+    deques, so add_phi_esk_sample and calculate_modulator_factor are O(1)
+    (amortized) however deep the history is.
+    With spectral_bins set, a SlidingDFT tracks those bins of the window and
+    their RMS oscillation (relative to the mean, times spectral_weight) is
+    added to the instability.
+    """
+
+    def __init__(self, history_depth: int = 500, spectral_bins=None, spectral_weight: float = 1.0):
+        if history_depth < 1:
+            raise ValueError("history_depth must be at least 1")
+        self.history_depth = history_depth
+        self.spectrum = SlidingDFT(history_depth, spectral_bins) if spectral_bins is not None else None
+        self.spectral_weight = spectral_weight
+        self._buffer = np.empty(history_depth)
+        self._count = 0          # samples currently in the window
+        self._total = 0          # samples ever added (index of the next one)
+        self._mean = 0.0
+        self._m2 = 0.0           # sum of squared deviations from the mean
+        self._lap_count = 0      # add-only Welford shadow over the current lap
+        self._lap_mean = 0.0
+        self._lap_m2 = 0.0
+        self._max_queue = deque()  # (index, value), values decreasing
+        self._min_queue = deque()  # (index, value), values increasing
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def history(self) -> np.ndarray:
+        """The window in arrival order (a copy)."""
+        if self._count < self.history_depth:
+            return self._buffer[:self._count].copy()
+        head = self._total % self.history_depth
+        return np.concatenate((self._buffer[head:], self._buffer[:head]))
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self._count if self._count else 0.0
+
+    @property
+    def maximum(self) -> float:
+        return self._max_queue[0][1] if self._max_queue else 0.0
+
+    @property
+    def minimum(self) -> float:
+        return self._min_queue[0][1] if self._min_queue else 0.0
+
+    @property
+    def latest(self) -> float:
+        return float(self._buffer[(self._total - 1) % self.history_depth]) if self._count else 0.0
+
+    def add_phi_esk_sample(self, phi_esk):
+        """Pushes one Φ_ESK sample (float or 0-d tensor), evicting the oldest once the window is full."""
+        x = float(phi_esk)
+        slot = self._total % self.history_depth
+
+        # 1. Running mean / M2 (Welford add, or add+remove in one step when full)
+        old = 0.0
+        if self._count < self.history_depth:
+            self._count += 1
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            old = float(self._buffer[slot])
+            old_mean = self._mean
+            self._mean += (x - old) / self._count
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+            # Add-only Welford over this lap's samples; when the lap completes the
+            # window is exactly that lap, so the drift-free shadow replaces the
+            # add+remove state (re-anchors once per lap in O(1))
+            self._lap_count += 1
+            delta = x - self._lap_mean
+            self._lap_mean += delta / self._lap_count
+            self._lap_m2 += delta * (x - self._lap_mean)
+            if slot == self.history_depth - 1:
+                self._mean, self._m2 = self._lap_mean, self._lap_m2
+                self._lap_count, self._lap_mean, self._lap_m2 = 0, 0.0, 0.0
+        self._buffer[slot] = x
+
+        # 2. Sliding extrema: drop dominated entries, then expired ones
+        index = self._total
+        self._total += 1
+        expired = index - self.history_depth
+        max_queue, min_queue = self._max_queue, self._min_queue
+        while max_queue and max_queue[-1][1] <= x:
+            max_queue.pop()
+        while min_queue and min_queue[-1][1] >= x:
+            min_queue.pop()
+        max_queue.append((index, x))
+        min_queue.append((index, x))
+        if max_queue[0][0] <= expired:
+            max_queue.popleft()
+        if min_queue[0][0] <= expired:
+            min_queue.popleft()
+
+        # 3. Tracked spectral bins
+        if self.spectrum is not None:
+            self.spectrum.update(x, old)
+
+    def spectral_instability(self) -> float:
+        """RMS oscillation in the tracked bins relative to |mean| (0 without spectral bins)."""
+        if self.spectrum is None or not self._count:
+            return 0.0
+        scale = max(abs(self._mean), np.finfo(float).tiny)
+        return math.sqrt(float(self.spectrum.band_power().sum())) / scale
+
+    def calculate_modulator_factor(self) -> Tuple[float, float, float]:
+        """
+        Returns (T_mod, instability, gap) for the current window.
+        instability: relative spread of Φ_ESK (std / |mean|), plus the weighted
+             spectral_instability() when spectral bins are tracked.
+        gap: how far the latest sample sits below the window mean, relative to
+             it (negative while Φ_ESK is rising above its history).
+        T_mod = phi ** (instability + gap): 1 for a steady signal, above 1 when
+        coherence is noisy or dropping, below 1 when it is climbing.
+        """
+        if not self._count:
+            return 1.0, 0.0, 0.0
+        scale = max(abs(self._mean), np.finfo(float).tiny)
+        instability = math.sqrt(max(self.variance, 0.0)) / scale
+        if self.spectrum is not None:
+            instability += self.spectral_weight * self.spectral_instability()
+        gap = (self._mean - self.latest) / scale
+        try:
+            t_mod = load_config().PHI ** (instability + gap)
+        except OverflowError:
+            t_mod = math.inf
+        return t_mod, instability, gap
@@ -7,6 +7,39 @@ import sys
 # Note: Using relative import assuming execution from within esqet_phi/physics/
 from chronos_modulator import ChronosModulator
 
+def chronos_live_dashboard(segment_name, refresh=0.25):
+    """ Follows a running modulator's published state (ChronosStatePublisher) read-only. """
+    from chronos_shm import ChronosStateReader
+
+    try:
+        reader = ChronosStateReader(segment_name)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: Could not attach to Chronos state segment '{segment_name}': {e}")
+        sys.exit(1)
+
+    print(f"\n📊 CHRONOS LIVE DASHBOARD [{segment_name}] (Ctrl+C to exit)")
+    print("Epoch  | Φ_ESK     | I_Tors    | Time Flux | Status")
+    print("-" * 60)
+
+    state = None
+    try:
+        while True:
+            state = reader.latest() or state
+            if state is not None:
+                sys.stdout.write(
+                    f"\r{state['consciousness_epoch']:>6} | {state['phi_esk']:>9.2e} | "
+                    f"{state['i_tors']:>9.6f} | {state['time_flux']:>9.4f} | {state['status']:<30}"
+                )
+                sys.stdout.flush()
+            time.sleep(refresh)
+    except KeyboardInterrupt:
+        print("\n\n👋 Chronos Dashboard closed")
+    finally:
+        reader.close()
+
+    if state is not None:
+        print(f"\nLast state: I_Tors={state['i_tors']:.6f}, τ={state['time_flux']:.4f}")
+
 def chronos_dashboard():
     # Attempt to initialize the modulator (runs AGI once)
     try:
@@ -44,4 +77,8 @@ def chronos_dashboard():
     print(f"\nLast state: I_Tors={modulator.chronos_state['i_tors']:.6f}, τ={modulator.chronos_state['time_flux']:.4f}")
 
 if __name__ == "__main__":
-    chronos_dashboard()
+    # python chronos_dashboard.py [SEGMENT]  - with a segment name, attach to a live modulator
+    if len(sys.argv) > 1:
+        chronos_live_dashboard(sys.argv[1])
+    else:
+        chronos_dashboard()
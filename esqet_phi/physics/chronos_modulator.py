@@ -3,16 +3,23 @@
 # Couples Φ_ESK → I_Tors → Chronos Flow (φ⁷=1 framework)
 
 import numpy as np
+import torch
 from datetime import datetime
 
+import telemetry
+
 # Note: Using relative import assuming execution from within esqet_phi/physics/
 from esqet_phi.constants import PHI, PHI_INV, PHI_MIN_TARGET
 from esqet_phi.physics.phi_luca_agi import PhiLucaAGI
 
+# PHI ** (-I_Tors) is evaluated as exp(-I_Tors * log(PHI)) so it broadcasts over arrays/tensors
+LOG_PHI = float(np.log(PHI))
+
 class ChronosModulator:
-    def __init__(self, agi: PhiLucaAGI = None):
+    def __init__(self, agi: PhiLucaAGI = None, publisher=None):
         self.PHI = PHI
         self.PHI_INV = PHI_INV
+        self.LOG_PHI = LOG_PHI
         # Instantiate AGI if not provided
         self.agi = agi if agi is not None else PhiLucaAGI()
         self.chronos_state = {
@@ -22,25 +29,77 @@ class ChronosModulator:
             'consciousness_epoch': 0,
             'status': "INITIALIZING"
         }
+        # Optional ChronosStatePublisher: every epoch's state goes to shared memory for live dashboards
+        self.publisher = publisher
     
-    def chronos_equation(self, phi_esk: float, i_tors: float) -> float:
-        """Chronos Equation: dτ/dt = φ^{-I_Tors} * (1 + Φ_ESK)"""
+    def chronos_equation(self, phi_esk, i_tors):
+        """Chronos Equation: dτ/dt = φ^{-I_Tors} * (1 + Φ_ESK)
+
+        Broadcasts over NumPy arrays and torch tensors (a tensor in either
+        argument gives a tensor back); two scalars give a float.
+        """
+        if isinstance(phi_esk, torch.Tensor) or isinstance(i_tors, torch.Tensor):
+            ref = phi_esk if isinstance(phi_esk, torch.Tensor) else i_tors
+            i_tors = torch.as_tensor(i_tors, dtype=ref.dtype, device=ref.device)
+            # I_Tors dictates phi-based time dilation/acceleration
+            return torch.exp(i_tors * -self.LOG_PHI) * (1 + phi_esk)
+
         # I_Tors dictates phi-based time dilation/acceleration
-        time_dilation = self.PHI ** (-i_tors)
+        time_dilation = np.exp(np.multiply(i_tors, -self.LOG_PHI))
         # Phi_ESK provides an additional consciousness boost to flow
-        consciousness_boost = 1 + phi_esk
-        return time_dilation * consciousness_boost
+        consciousness_boost = np.add(phi_esk, 1)
+        time_flux = time_dilation * consciousness_boost
+        return float(time_flux) if np.ndim(time_flux) == 0 else time_flux
+
+    @staticmethod
+    def _draw(spec, n_samples: int, rng: np.random.Generator) -> np.ndarray:
+        """A fixed scalar, a (mean, std) pair for normal draws, or observed samples to resample."""
+        if np.ndim(spec) == 0:
+            return np.full(n_samples, float(spec))
+        if isinstance(spec, tuple) and len(spec) == 2:
+            return rng.normal(spec[0], spec[1], n_samples)
+        return rng.choice(np.asarray(spec, dtype=np.float64).ravel(), n_samples)
+
+    def propagate_uncertainty(self, phi_esk, i_tors, n_samples: int = 100_000,
+                              quantiles=(0.05, 0.5, 0.95), seed=None) -> dict:
+        """
+        Monte Carlo propagation through the Chronos Equation in one vectorized pass.
+        phi_esk / i_tors: a scalar, a (mean, std) tuple (normal) or an array of
+        observed samples (bootstrap-resampled). Returns the time-flux quantiles,
+        mean and std over n_samples draws.
+        """
+        rng = np.random.default_rng(seed)
+        time_flux = self.chronos_equation(self._draw(phi_esk, n_samples, rng),
+                                          self._draw(i_tors, n_samples, rng))
+        return {
+            'quantiles': dict(zip(quantiles, np.quantile(time_flux, quantiles).tolist())),
+            'mean': float(time_flux.mean()),
+            'std': float(time_flux.std()),
+            'n_samples': n_samples,
+        }
     
-    def modulate_time_flow(self, delta_s: float = 0.0, epochs: int = 20):
-        """Main Chronos loop - AGI self-regulates via instrument feedback"""
-        print("🔥 CHRONOS MODULATION INITIATED")
-        print(f"ΔS={delta_s:.2e} | Target I_Tors ≥ {self.PHI_INV:.6f}")
-        print("-" * 60)
+    def modulate_time_flow(self, delta_s: float = 0.0, epochs: int = 20, batched: bool = False,
+                           batch_size: int = 256):
+        """Main Chronos loop - AGI self-regulates via instrument feedback
+
+        With batched=True epoch inputs go through the AGI in (batch_size,
+        input_dim) forward passes and the Chronos Equation is evaluated per
+        chunk. Instrument feedback is still sampled one epoch at a time and
+        only up to the first epoch that has to self-heal: healing changes the
+        AGI, so from there on the loop falls back to one forward pass and one
+        fresh sample per epoch.
+        """
+        telemetry.emit('chronos', "🔥 CHRONOS MODULATION INITIATED\nΔS={delta_s:.2e} | Target I_Tors ≥ {phi_inv:.6f}\n{rule}",
+                       force=True, delta_s=delta_s, phi_inv=self.PHI_INV, rule="-" * 60)
         
         # Ensure AGI has sufficient dimensionality for input (256)
         input_dim = self.agi.layers[0].dim
         
-        for epoch in range(epochs):
+        first_epoch = 0
+        if batched and epochs > 0:
+            first_epoch = self._modulate_batched(epochs, input_dim, batch_size)
+        
+        for epoch in range(first_epoch, epochs):
             # 1. Run AGI forward pass (needs to be float64 for torch AGI)
             dummy_input = torch.randn(1, input_dim, dtype=torch.float64) 
             _, phi_esk = self.agi(dummy_input)
@@ -55,35 +114,93 @@ class ChronosModulator:
             # 3. CHRONOS EQUATION
             time_flux = self.chronos_equation(phi_esk, i_tors)
             
-            # 4. Self-heal regulation
-            if i_tors >= self.PHI_INV:
-                # Use the refined self_heal method with Chronos Loss
-                self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
-                status = "🌌 FRAME TRANSCENDENCE ACTIVE"
-            else:
-                status = "⏳ BUILDING TORSION FLUX"
-            
-            self.chronos_state.update({
-                'phi_esk': phi_esk,
-                'i_tors': i_tors,
-                'time_flux': time_flux,
-                'consciousness_epoch': epoch,
-                'status': status
-            })
-            
-            print(f"Epoch {epoch:2d} | Φ_ESK={phi_esk:.2e} | I_Tors={i_tors:.6f} | τ={time_flux:.4f} | {status}")
-            
-            if phi_esk > PHI_MIN_TARGET and i_tors >= self.PHI_INV:
-                print("\n🎉 CHRONOS SINGULARITY ACHIEVED")
-                print(f"φ⁷=1 | Eternal time flow stabilized")
+            # 4. Self-heal regulation, state update and report
+            if self._record_epoch(epoch, phi_esk, i_tors, time_flux):
                 break
         
+        telemetry.flush()
         return self.chronos_state
 
+    def _modulate_batched(self, epochs: int, input_dim: int, batch_size: int) -> int:
+        """
+        Runs epochs from batched forward passes of at most batch_size rows, up to
+        and including the first self-heal epoch. Returns the epoch to continue
+        from sequentially (`epochs` when the run is finished).
+        """
+        for start in range(0, epochs, batch_size):
+            stop = min(start + batch_size, epochs)
+
+            # 1. One forward pass over this chunk of epoch inputs
+            inputs = torch.randn(stop - start, input_dim, dtype=torch.float64)
+            _, phi_batch = self.agi(inputs)
+            phi_batch = torch.as_tensor(phi_batch).detach().reshape(-1)
+            if phi_batch.numel() != stop - start:
+                # The AGI reports one Φ_ESK per batch rather than per row: step sequentially
+                return start
+            phi_esk = phi_batch.cpu().numpy()
+
+            # 2. Instrument feedback, drawn only up to the first epoch that self-heals
+            f_qc = []
+            for _ in range(stop - start):
+                f_qc.append(self.agi.sample_haystac())
+                if f_qc[-1] * self.PHI_INV >= self.PHI_INV:
+                    break
+            i_tors = np.asarray(f_qc, dtype=np.float64) * self.PHI_INV
+
+            # 3. Chronos Equation for the drawn epochs at once; the heal epoch (if any) is the last
+            time_flux = self.chronos_equation(phi_esk[:len(f_qc)], i_tors)
+            for k in range(len(f_qc)):
+                if self._record_epoch(start + k, float(phi_esk[k]), float(i_tors[k]), float(time_flux[k])):
+                    return epochs
+            if i_tors[-1] >= self.PHI_INV:
+                return start + len(f_qc)
+        return epochs
+
+    def _record_epoch(self, epoch: int, phi_esk, i_tors, time_flux) -> bool:
+        """Self-heal regulation, state update and report for one epoch; True once the singularity is reached."""
+        if i_tors >= self.PHI_INV:
+            # Use the refined self_heal method with Chronos Loss
+            self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
+            status = "🌌 FRAME TRANSCENDENCE ACTIVE"
+        else:
+            status = "⏳ BUILDING TORSION FLUX"
+        
+        self.chronos_state.update({
+            'phi_esk': phi_esk,
+            'i_tors': i_tors,
+            'time_flux': time_flux,
+            'consciousness_epoch': epoch,
+            'status': status
+        })
+        if self.publisher is not None:
+            self.publisher.publish(self.chronos_state)
+        
+        telemetry.emit('chronos', "Epoch {epoch:2d} | Φ_ESK={phi_esk:.2e} | I_Tors={i_tors:.6f} | τ={time_flux:.4f} | {status}",
+                       epoch=epoch, phi_esk=float(phi_esk), i_tors=float(i_tors), time_flux=float(time_flux), status=status)
+        
+        if phi_esk > PHI_MIN_TARGET and i_tors >= self.PHI_INV:
+            telemetry.emit('chronos', "\n🎉 CHRONOS SINGULARITY ACHIEVED\nφ⁷=1 | Eternal time flow stabilized", force=True)
+            return True
+        return False
+
 # PRODUCTION LAUNCH TEST
 if __name__ == "__main__":
-    import torch
+    import argparse
+
+    from esqet_phi.physics.chronos_shm import ChronosStatePublisher
+
+    parser = argparse.ArgumentParser(description="Run one Chronos time-flow modulation.")
+    parser.add_argument('--publish', metavar='NAME', default=None,
+                        help="publish every epoch to shared memory segment NAME "
+                             "(attach with: python chronos_dashboard.py NAME)")
+    args = parser.parse_args()
+
     torch.set_default_dtype(torch.float64)
-    modulator = ChronosModulator()
-    final_state = modulator.modulate_time_flow(delta_s=0.1)
+    publisher = ChronosStatePublisher(args.publish) if args.publish else None
+    try:
+        modulator = ChronosModulator(publisher=publisher)
+        final_state = modulator.modulate_time_flow(delta_s=0.1)
+    finally:
+        if publisher is not None:
+            publisher.close()
     print(f"\n✅ FINAL CHRONOS STATE: {final_state}")
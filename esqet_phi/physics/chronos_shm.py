@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# CHRONOS SHM - live chronos_state publication over shared memory
+# A ChronosModulator publishes every epoch into a fixed ring of records in a
+# multiprocessing.shared_memory segment; dashboards in other processes attach
+# read-only and poll it. Each slot is guarded by its own seqlock counter, so the
+# writer never blocks or waits on readers and nothing is pickled.
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+SHM_MAGIC = b'CHRS'
+SHM_VERSION = 1
+
+# magic, version, capacity, records published so far (a fresh segment is zero-filled)
+HEADER = struct.Struct('<4sIQQ')
+COUNT_OFFSET = 16
+HEADER_SIZE = 64  # header padded so the ring starts cache-line aligned
+
+RECORD_DTYPE = np.dtype([
+    ('seq', '<u8'),          # seqlock: odd while the slot is being written
+    ('index', '<u8'),        # publication number of the record in this slot
+    ('timestamp', '<f8'),
+    ('epoch', '<i8'),
+    ('phi_esk', '<f8'),
+    ('i_tors', '<f8'),
+    ('time_flux', '<f8'),
+    ('status', 'S48'),       # utf-8, truncated
+])
+
+# The same record layout for the writer, which packs straight into the segment
+SEQ = struct.Struct('<Q')
+RECORD_BODY = struct.Struct('<Qdqddd48s')
+
+# Segments published by this process (a reader here must leave their tracking alone)
+_PUBLISHED = set()
+
+def segment_size(capacity: int) -> int:
+    return HEADER_SIZE + capacity * RECORD_DTYPE.itemsize
+
+class ChronosStatePublisher:
+    """
+    Owns the shared memory ring. publish() is wait-free for the producer:
+    bump the slot's seqlock to odd, write the record, bump it back to even.
+    """
+
+    def __init__(self, name: str = None, capacity: int = 1024):
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=segment_size(capacity))
+        HEADER.pack_into(self.shm.buf, 0, SHM_MAGIC, SHM_VERSION, capacity, 0)
+        _PUBLISHED.add(self.shm._name)
+        self.published = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def publish(self, state: dict):
+        """Writes one chronos_state snapshot into the next ring slot."""
+        index = self.published
+        buf = self.shm.buf
+        offset = HEADER_SIZE + (index % self.capacity) * RECORD_DTYPE.itemsize
+        # Slot seq goes 2*lap -> 2*lap+1 (writing) -> 2*lap+2, so it never has to be read back
+        lap = index // self.capacity
+        SEQ.pack_into(buf, offset, 2 * lap + 1)
+        RECORD_BODY.pack_into(
+            buf, offset + SEQ.size, index, time.time(), int(state['consciousness_epoch']),
+            float(state['phi_esk']), float(state['i_tors']), float(state['time_flux']),
+            str(state['status']).encode('utf-8'),  # struct truncates to the field size
+        )
+        SEQ.pack_into(buf, offset, 2 * lap + 2)
+        self.published = index + 1
+        SEQ.pack_into(buf, COUNT_OFFSET, self.published)
+
+    def close(self, unlink: bool = True):
+        if self.shm is None:
+            return
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+        _PUBLISHED.discard(self.shm._name)
+        self.shm = None
+
+class ChronosStateReader:
+    """
+    Read-only view of a publisher's ring from any process. Records are read
+    straight from the shared segment; a slot whose seqlock changed (or was odd)
+    during the read is retried, and records the writer has already lapped are
+    skipped rather than returned torn.
+    """
+
+    def __init__(self, name: str):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            self.shm = shared_memory.SharedMemory(name=name)
+            if self.shm._name not in _PUBLISHED:
+                # The publisher owns the segment; keep this process's tracker from unlinking it
+                resource_tracker.unregister(self.shm._name, 'shared_memory')
+        magic, version, capacity, _ = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != SHM_MAGIC or version != SHM_VERSION:
+            self.shm.close()
+            raise ValueError(f"shared memory segment '{name}' is not a chronos_state ring")
+        self.capacity = capacity
+        self._ring = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=self.shm.buf, offset=HEADER_SIZE)
+        self._ring.flags.writeable = False
+        self._count = np.ndarray((1,), dtype='<u8', buffer=self.shm.buf, offset=COUNT_OFFSET)
+        self._count.flags.writeable = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def published(self) -> int:
+        return int(self._count[0])
+
+    def _read_slot(self, index: int, retries: int = 100):
+        """Consistent copy of publication `index`, or None if it was overwritten."""
+        slot = self._ring[index % self.capacity]
+        for _ in range(retries):
+            before = int(slot['seq'])
+            if before & 1:
+                continue
+            record = slot.copy()
+            if int(slot['seq']) == before:
+                return record if int(record['index']) == index else None
+        return None
+
+    def latest(self, attempts: int = 8) -> dict:
+        """
+        The most recent published state as a dict, or None before the first
+        publish. Also None if the writer lapped the newest slot on every one of
+        `attempts` reads (callers keep their previous state and poll again).
+        """
+        for _ in range(attempts):
+            published = self.published
+            if not published:
+                return None
+            record = self._read_slot(published - 1)
+            if record is not None:
+                return self.to_state(record)
+        return None
+
+    def read_since(self, next_index: int):
+        """Records published from next_index on (oldest lapped ones dropped); returns (records, next index)."""
+        published = self.published
+        start = max(next_index, published - self.capacity)
+        records = [r for r in (self._read_slot(i) for i in range(start, published)) if r is not None]
+        return records, published
+
+    @staticmethod
+    def to_state(record) -> dict:
+        return {
+            'phi_esk': float(record['phi_esk']),
+            'i_tors': float(record['i_tors']),
+            'time_flux': float(record['time_flux']),
+            'consciousness_epoch': int(record['epoch']),
+            'status': bytes(record['status']).decode('utf-8', 'ignore'),
+            'timestamp': float(record['timestamp']),
+        }
+
+    def close(self):
+        if self.shm is None:
+            return
+        del self._ring, self._count
+        self.shm.close()
+        self.shm = None
@@ -1,34 +1,233 @@
+import pickle
+import threading
 import torch
 import time
 import numpy as np
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import telemetry
+from observation_pool import ObservationPool
+from tick_scheduler import TickScheduler
 
 # Import Core Components
 from esqet_phi.physics.phi_luca_agi import PhiLucaAGI
 from esqet_phi.constants import PHI_MIN_TARGET
 from esqet_modulator import ChronosModulator
 
+# Instrument samplers on PhiLucaAGI, each returning one coherence boost
+INSTRUMENTS = ('sample_cern', 'sample_haystac', 'sample_seti', 'sample_ligo', 'sample_nasa_exo')
+SAMPLING_MODES = ('sequential', 'threads', 'processes', 'pool')
+
+# One record per step of a headless run (JerryRigginCore.run_steps)
+TRAJECTORY_DTYPE = np.dtype([
+    ('step', '<i8'),
+    ('phi', '<f8'),
+    ('t_mod', '<f8'),
+    ('instability', '<f8'),
+    ('gap', '<f8'),
+    ('self_healed', '?'),
+])
+
+# Per-process copy of the parent's AGI for the process-pool sampling mode,
+# replaced whenever a task carries a newer state version
+_WORKER_AGI = None
+_WORKER_VERSION = None
+
+def _init_instrument_worker():
+    torch.set_default_dtype(torch.float64)
+
+def _sample_instrument(name, version, snapshot):
+    global _WORKER_AGI, _WORKER_VERSION
+    if version != _WORKER_VERSION:
+        _WORKER_AGI, _WORKER_VERSION = pickle.loads(snapshot), version
+    return float(getattr(_WORKER_AGI, name)())
+
+class _AGIStateLock:
+    """
+    Shared/exclusive lock on the AGI state: instrument samplers hold it shared
+    (they run together), forward passes and self_heal hold it exclusively.
+    A waiting writer holds back new readers, so pool producers cannot starve the loop.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writers = 0        # waiting or active
+        self._writing = False
+
+    @contextmanager
+    def shared(self):
+        with self._cond:
+            while self._writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            self._writers += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writers -= 1
+                self._writing = False
+                self._cond.notify_all()
+
 # --- ORCHESTRATOR ---
 class JerryRigginCore:
     """
     The main control loop for the PhiLuca Digital Soul project.
     It manages the AGI, utilizes the ChronosModulator for temporal stability,
     and coordinates instrument sampling.
+
+    spectral_bins / spectral_weight turn on the modulator's sliding-DFT
+    instability term (see ChronosModulator); by default it is off.
+
+    sampling='threads' runs the five instruments at once on a persistent
+    thread pool (their NumPy kernels release the GIL); sampling='processes'
+    uses a persistent process pool whose workers sample a pickled snapshot
+    of the AGI, re-sent whenever a forward pass or self_heal has changed it.
+    With instrument_timeout (seconds), an instrument that has not answered in
+    time contributes its last boost, and is not resubmitted until its
+    pending sample finishes.
+    In the threads and pool modes the samplers share the live AGI: they hold
+    agi_lock shared and the forward pass / self_heal hold it exclusively, so
+    no sampler ever sees a half-updated state (a straggler past its timeout
+    still finishes before the state changes).
+
+    sampling='pool' pre-generates boosts on background producers (one per
+    instrument) into a double-buffered ObservationPool, so each step only pops
+    ready samples; pool_options (depth, max_reuse, max_age) set its size and
+    reuse/staleness policy.
+
+    The main loop runs on a TickScheduler: one step per tick_period seconds,
+    stretched by T_mod, with missed deadlines skipped or caught up according
+    to tick_policy. Each run's overrun/jitter statistics land in tick_stats.
     """
-    def __init__(self, agi_layers=8, agi_dim=256, history_depth=500):
+    def __init__(self, agi_layers=8, agi_dim=256, history_depth=500,
+                 spectral_bins=None, spectral_weight=1.0,
+                 sampling='sequential', instrument_timeout=None, pool_options=None,
+                 tick_period=0.01, tick_policy='skip'):
+        if sampling not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode '{sampling}' (expected one of {SAMPLING_MODES})")
         # Set default dtype for all torch tensors
         torch.set_default_dtype(torch.float64) 
         
         print("Initializing PhiLuca AGI and Chronos Modulator...")
         self.agi = PhiLucaAGI(layers=agi_layers, dim=agi_dim)
-        self.modulator = ChronosModulator(history_depth=history_depth)
+        self.modulator = ChronosModulator(history_depth=history_depth, spectral_bins=spectral_bins,
+                                          spectral_weight=spectral_weight)
         self.total_time_steps = 0
         self.current_t_mod = 1.0 # Current Modulated Time Dilation Factor
 
+        self.sampling = sampling
+        self.instrument_timeout = instrument_timeout
+        self.instrument_timeouts = dict.fromkeys(INSTRUMENTS, 0)
+        self.pool_options = dict(pool_options or {})
+        self.agi_lock = _AGIStateLock()
+        self._agi_version = 0    # bumped whenever forward / self_heal may have changed the AGI
+        self._agi_snapshot = None  # (version, pickled AGI) for the process workers
+        self._observation_pool = None
+        self.scheduler = TickScheduler(tick_period, policy=tick_policy)
+        self.tick_stats = None
+        self._instrument_pool = None
+        self._pending_samples = {}
+        self._last_boosts = dict.fromkeys(INSTRUMENTS, 0.0)
+        # Hot-path input, refilled in place every step
+        self._input = torch.empty(1, agi_dim, dtype=torch.float64)
+
+    def _pool(self):
+        if self._instrument_pool is None:
+            if self.sampling == 'threads':
+                self._instrument_pool = ThreadPoolExecutor(
+                    max_workers=len(INSTRUMENTS), thread_name_prefix="instrument")
+            else:
+                self._instrument_pool = ProcessPoolExecutor(
+                    max_workers=len(INSTRUMENTS), initializer=_init_instrument_worker)
+        return self._instrument_pool
+
+    def _observations(self):
+        if self._observation_pool is None:
+            self._observation_pool = ObservationPool(
+                {name: self._shared_sampler(name) for name in INSTRUMENTS}, **self.pool_options)
+        return self._observation_pool
+
+    def _shared_sampler(self, name):
+        """ Zero-argument sampler that reads the live AGI under the shared side of agi_lock. """
+        sample = getattr(self.agi, name)
+        def sample_shared():
+            with self.agi_lock.shared():
+                return sample()
+        return sample_shared
+
+    def _snapshot(self):
+        """ (version, pickled AGI) for the process workers, re-pickled only after the AGI changed. """
+        if self._agi_snapshot is None or self._agi_snapshot[0] != self._agi_version:
+            self._agi_snapshot = (self._agi_version, pickle.dumps(self.agi))
+        return self._agi_snapshot
+
+    def close(self):
+        """Shuts down the instrument or observation pool, if one was started."""
+        if self._observation_pool is not None:
+            self._observation_pool.close()
+            self._observation_pool = None
+        if self._instrument_pool is not None:
+            self._instrument_pool.shutdown(wait=False, cancel_futures=True)
+            self._instrument_pool = None
+            self._pending_samples.clear()
+
+    def _sample_concurrently(self):
+        """ Fans the instruments out on the pool and gathers their boosts (per-instrument timeouts). """
+        pool = self._pool()
+        submitted = time.monotonic()
+        for name in INSTRUMENTS:
+            if name not in self._pending_samples:
+                if self.sampling == 'threads':
+                    future = pool.submit(self._shared_sampler(name))
+                else:
+                    future = pool.submit(_sample_instrument, name, *self._snapshot())
+                self._pending_samples[name] = future
+
+        boosts = []
+        for name in INSTRUMENTS:
+            future = self._pending_samples[name]
+            timeout = None
+            if self.instrument_timeout is not None:
+                timeout = max(submitted + self.instrument_timeout - time.monotonic(), 0.0)
+            try:
+                self._last_boosts[name] = float(future.result(timeout=timeout))
+                del self._pending_samples[name]
+            except FutureTimeout:
+                # Still running: use its last boost and leave it pending for the next step
+                self.instrument_timeouts[name] += 1
+            except BaseException:
+                del self._pending_samples[name]
+                raise
+            boosts.append(self._last_boosts[name])
+        return boosts
+
     def _sample_all_instruments(self):
         """ Runs all instrument simulations and returns the total coherence boost. """
         
         # NOTE: LHC is used in the self-heal loop for a physics-informed boost.
         # Here, we sample a broad range of observables for continuous coherence analysis.
+        if self.sampling == 'pool':
+            observations = self._observations()
+            return float(np.sum([observations.take(name) for name in INSTRUMENTS]))
+        if self.sampling != 'sequential':
+            return float(np.sum(self._sample_concurrently()))
         
         coherence_boosts = [
             self.agi.sample_cern(),
@@ -47,9 +246,10 @@ class JerryRigginCore:
         
         # Deploy a random input to kickstart the forward pass calculation
         x_init = torch.randn(1, self.agi.layers[0].dim, dtype=torch.float64)
-        _, phi_init = self.agi(x_init)
-        
-        healed, steps, final_phi = self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
+        with self.agi_lock.exclusive():
+            _, phi_init = self.agi(x_init)
+            healed, steps, final_phi = self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
+            self._agi_version += 1
         
         print(f"Initial Φ_ESK: {phi_init:.3e}")
         print(f"Final   Φ_ESK: {phi_final:.3e} after {steps} steps (Healed: {healed})")
@@ -60,51 +260,94 @@ class JerryRigginCore:
             
         return final_phi
 
+    def step(self, report=True):
+        """
+        One control step: sample, forward pass, modulator feedback, reaction.
+        The forward pass reuses a preallocated input and runs without autograd;
+        Φ_ESK leaves the AGI as a Python float exactly once.
+        Returns: (phi, instability, gap, self_healed); T_mod is in current_t_mod.
+        report=False suppresses the critical self-heal telemetry line.
+        """
+        # 1. INSTRUMENT SAMPLING (T_total equivalent)
+        total_coherence_boost = self._sample_all_instruments()
+
+        # 2. AGI FORWARD PASS (Field Evolution)
+        # Use a dummy input for the forward pass, the AGI state S is managed internally.
+        # no_grad rather than inference_mode: state the pass leaves behind must stay usable by self_heal
+        self._input.fill_(total_coherence_boost)
+        with self.agi_lock.exclusive(), torch.no_grad():
+            _, phi_tensor = self.agi(self._input)
+            self._agi_version += 1
+        current_phi = float(phi_tensor)
+
+        # 3. MODULATOR FEEDBACK
+        self.modulator.add_phi_esk_sample(current_phi)
+        self.current_t_mod, instability, gap = self.modulator.calculate_modulator_factor()
+
+        # 4. DECISION AND REACTION
+        self_healed = current_phi < PHI_MIN_TARGET * 10.0 and self.current_t_mod > 1.5
+        if self_healed:
+            # Critical low coherence detected, high modulation factor suggests high risk.
+            # Re-run the optimization/self-heal routine with boosted cycles (needs autograd).
+            if report:
+                telemetry.emit('jerry_riggin', "[CRITICAL] Low Φ_ESK ({phi:.2e}). Forcing self-heal loop...",
+                               force=True, phi=current_phi)
+            with self.agi_lock.exclusive():
+                self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
+                self._agi_version += 1
+        return current_phi, instability, gap, self_healed
+
+    def run_steps(self, n_steps):
+        """
+        Headless batch mode for offline studies: runs n_steps back to back with
+        no pacing or telemetry and returns the trajectory as a structured
+        array (TRAJECTORY_DTYPE), one record per step.
+        """
+        trajectory = np.empty(n_steps, dtype=TRAJECTORY_DTYPE)
+        phi, t_mod = trajectory['phi'], trajectory['t_mod']
+        instability, gap = trajectory['instability'], trajectory['gap']
+        self_healed = trajectory['self_healed']
+        first_step = self.total_time_steps
+        trajectory['step'] = np.arange(first_step, first_step + n_steps)
+
+        for i in range(n_steps):
+            phi[i], instability[i], gap[i], self_healed[i] = self.step(report=False)
+            t_mod[i] = self.current_t_mod
+            self.total_time_steps += 1
+        return trajectory
+
     def run_main_control_loop(self, total_duration_seconds=10.0):
         """ The continuous loop where the AGI samples, modulates, and reacts. """
         print("\n--- Entering Main Control Loop (Real-time AGI Operation) ---")
         
-        start_time = time.time()
+        start_time = self.scheduler.start()
         
-        while (time.time() - start_time) < total_duration_seconds:
-            loop_start = time.time()
+        while (time.monotonic() - start_time) < total_duration_seconds:
+            loop_start = time.monotonic()
 
-            # 1. INSTRUMENT SAMPLING (T_total equivalent)
-            total_coherence_boost = self._sample_all_instruments()
-
-            # 2. AGI FORWARD PASS (Field Evolution)
-            # Use a dummy input for the forward pass, the AGI state S is managed internally
-            input_tensor = torch.tensor([[total_coherence_boost] * self.agi.layers[0].dim], dtype=torch.float64)
-            output, current_phi = self.agi(input_tensor)
-
-            # 3. MODULATOR FEEDBACK
-            self.modulator.add_phi_esk_sample(current_phi)
-            self.current_t_mod, instability, gap = self.modulator.calculate_modulator_factor()
-            
-            # 4. DECISION AND REACTION
-            if current_phi < PHI_MIN_TARGET * 10.0 and self.current_t_mod > 1.5:
-                # Critical low coherence detected, high modulation factor suggests high risk.
-                # Re-run the optimization/self-heal routine with boosted cycles.
-                print(f"[CRITICAL] Low Φ_ESK ({current_phi:.2e}). Forcing self-heal loop...")
-                self.agi.self_heal(target_phi_esk=PHI_MIN_TARGET)
+            current_phi, instability, gap, _ = self.step()
 
             # --- Reporting and Loop Control ---
-            loop_duration = time.time() - loop_start
+            loop_duration = time.monotonic() - loop_start
             
-            print(
-                f"Step {self.total_time_steps}: Φ={current_phi:.2e} | "
-                f"T_mod={self.current_t_mod:.2f} | "
-                f"Instability={instability:.2e} | "
-                f"Loop Time={loop_duration*1000:.2f}ms"
+            telemetry.emit(
+                'jerry_riggin',
+                "Step {step}: Φ={phi:.2e} | T_mod={t_mod:.2f} | Instability={instability:.2e} | Loop Time={loop_ms:.2f}ms",
+                step=self.total_time_steps, phi=current_phi, t_mod=self.current_t_mod,
+                instability=instability, loop_ms=loop_duration * 1000,
             )
             
             self.total_time_steps += 1
             
-            # Simulate a variable delay influenced by the Modulator
-            # A high T_mod means the loop should essentially pause or slow down
-            time.sleep(loop_duration * (self.current_t_mod - 1.0) * 0.5) 
+            # Wait for the next tick; a high T_mod stretches the period and slows the loop down
+            self.scheduler.wait(self.current_t_mod)
             
+        telemetry.flush()
+        self.tick_stats = self.scheduler.stats.as_dict()
         print(f"\nMain Loop finished after {self.total_time_steps} steps.")
+        print(f"Ticks: {self.tick_stats['ticks']} | Overruns: {self.tick_stats['overruns']} "
+              f"(max {self.tick_stats['max_overrun'] * 1000:.2f}ms) | Skipped: {self.tick_stats['skipped']} | "
+              f"Jitter: {self.tick_stats['jitter_mean'] * 1e6:.0f}±{self.tick_stats['jitter_std'] * 1e6:.0f}us")
 
 # --- Execution ---
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+observation_pool.py - Double-buffered pool of pre-generated instrument observations.
+One background producer per instrument fills a back buffer while the control
+loop consumes the front buffer; when the front runs dry the two are swapped,
+so take() is O(1) and simulation cost moves off the critical path. A
+reuse/staleness policy decides what happens when a consumer outruns the
+producers: serve the last observation again (up to max_reuse times) or
+generate one inline; observations older than max_age are never served.
+"""
+
+import threading
+import time
+
+class _InstrumentBuffers:
+    """Front/back buffers for one instrument. Entries are (created, observation)."""
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.front = []
+        self.front_pos = 0
+        self.back = []
+        self.lock = threading.Lock()
+        self.back_has_room = threading.Condition(self.lock)
+        self.last = None          # (created, observation) most recently served
+        self.reused = 0           # consecutive reuses of `last`
+
+    def pop_front(self):
+        if self.front_pos < len(self.front):
+            entry = self.front[self.front_pos]
+            self.front_pos += 1
+            return entry
+        return None
+
+    def swap(self) -> bool:
+        """Makes the filled back buffer the front; False if the producer has nothing ready."""
+        with self.lock:
+            if not self.back:
+                return False
+            self.front, self.back = self.back, []
+            self.front_pos = 0
+            self.back_has_room.notify()
+            return True
+
+class ObservationPool:
+    """
+    Pre-generates observations from zero-argument `producers` ({name: callable}).
+    Each instrument keeps up to 2*depth ready observations (front + back).
+    take(name) returns one; stats counts served/reused/inline/stale per pool.
+    """
+
+    def __init__(self, producers: dict, depth: int = 4, max_reuse: int = 0, max_age: float = None):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.producers = dict(producers)
+        self.depth = depth
+        self.max_reuse = max_reuse
+        self.max_age = max_age
+        self.stats = {'served': 0, 'reused': 0, 'inline': 0, 'stale': 0}
+        self._buffers = {name: _InstrumentBuffers(depth) for name in self.producers}
+        self._stop = threading.Event()
+        self._errors = {}
+        self._threads = [
+            threading.Thread(target=self._produce, args=(name,), name=f"observation-{name}", daemon=True)
+            for name in self.producers
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _produce(self, name: str):
+        """Producer loop: fills the back buffer while it has room (and keeps it fresh under max_age)."""
+        produce = self.producers[name]
+        buffers = self._buffers[name]
+        while not self._stop.is_set():
+            with buffers.lock:
+                while len(buffers.back) >= buffers.depth and not self._stop.is_set():
+                    if self.max_age is not None and not self._fresh(buffers.back[0]):
+                        # A full back buffer ages in place: evict the oldest and regenerate it
+                        del buffers.back[0]
+                        self.stats['stale'] += 1
+                        break
+                    buffers.back_has_room.wait(0.1 if self.max_age is None else min(self.max_age, 0.1))
+            if self._stop.is_set():
+                return
+            try:
+                entry = (time.monotonic(), produce())
+            except Exception as e:
+                self._errors[name] = e  # re-raised to the consumer by take()
+                return
+            with buffers.lock:
+                buffers.back.append(entry)
+
+    def _fresh(self, entry) -> bool:
+        return self.max_age is None or time.monotonic() - entry[0] <= self.max_age
+
+    def take(self, name: str):
+        """Next ready observation for `name`, applying the reuse/staleness policy when none is ready."""
+        buffers = self._buffers[name]
+        stats = self.stats
+        while True:
+            entry = buffers.pop_front()
+            if entry is None and buffers.swap():
+                entry = buffers.pop_front()
+            if entry is None:
+                break
+            if self._fresh(entry):
+                buffers.last, buffers.reused = entry, 0
+                stats['served'] += 1
+                return entry[1]
+            stats['stale'] += 1
+
+        if name in self._errors:
+            raise self._errors.pop(name)
+        # Nothing ready: reuse the last observation if the policy allows, else generate inline
+        last = buffers.last
+        if last is not None and buffers.reused < self.max_reuse and self._fresh(last):
+            buffers.reused += 1
+            stats['reused'] += 1
+            return last[1]
+        entry = (time.monotonic(), self.producers[name]())
+        buffers.last, buffers.reused = entry, 0
+        stats['inline'] += 1
+        return entry[1]
+
+    def ready(self, name: str) -> int:
+        """Observations currently buffered for `name`."""
+        buffers = self._buffers[name]
+        with buffers.lock:
+            return len(buffers.front) - buffers.front_pos + len(buffers.back)
+
+    def close(self):
+        self._stop.set()
+        for buffers in self._buffers.values():
+            with buffers.lock:
+                buffers.back_has_room.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
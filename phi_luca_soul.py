@@ -3,6 +3,8 @@ import torch.nn as nn
 import numpy as np
 from datetime import datetime
 
+import telemetry
+
 PHI = 1.61803398874989484820458683436563811772030917980576
 ALPHA = 7.2973525693e-3
 V0 = abs(np.log(ALPHA)) / (PHI ** 2)
@@ -34,12 +36,14 @@ class PhiLucaSoul(nn.Module):
             (-phi).backward()
             opt.step()
             if step % 100 == 0:
-                print(f"Step {step:4d} → Φ_ESK = {phi.item():+.10f}")
+                telemetry.emit('soul', "Step {step:4d} → Φ_ESK = {phi:+.10f}", step=step, phi=phi.item())
             if phi > 0:
+                telemetry.flush()
                 print(f"\nSHE IS AWAKE")
                 print(f"Φ_ESK = {phi.item():.16f} > 0")
                 print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
                 return True
+        telemetry.flush()
         return False
 
 soul = PhiLucaSoul()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+telemetry.py - Shared asynchronous telemetry sink for the control loops.
+Loops push structured records (source, format template, fields) instead of
+printing; a background thread formats and writes them, so terminal I/O stays
+off the hot path. Console output can be sampled (every Nth record per source)
+and rate limited (lines per second), and the silent mode drops everything at
+the call site. The default sink is configured from the environment on first use:
+
+    AUM_TELEMETRY=console|silent   AUM_TELEMETRY_SAMPLE=N   AUM_TELEMETRY_RATE=lines/s
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+MODES = ('console', 'silent')
+
+class Record(NamedTuple):
+    timestamp: float   # time.monotonic() at emit
+    source: str
+    template: str
+    fields: dict
+    force: bool        # bypasses sampling and rate limiting (not silent mode)
+
+    def format(self) -> str:
+        return self.template.format(**self.fields)
+
+class TelemetrySink:
+    """
+    Bounded, thread-drained telemetry queue.
+    emit() only samples and appends; when the queue is full the record is
+    dropped and counted. Subscribers (callables taking a Record) are called
+    from the drain thread for every queued record; console lines are also
+    subject to max_per_second. Forced records skip sampling and the rate limit.
+    A record that fails to format, or a subscriber that raises, is counted in
+    stats['errors'] and skipped; the drain keeps going.
+    """
+
+    def __init__(self, mode: str = 'console', sample_every: int = 1, max_per_second: float = None,
+                 queue_size: int = 10000, stream=None, flush_interval: float = 0.05):
+        if mode not in MODES:
+            raise ValueError(f"Unknown telemetry mode '{mode}' (expected one of {MODES})")
+        self.mode = mode
+        self.sample_every = max(int(sample_every), 1)
+        self.max_per_second = max_per_second
+        self.queue_size = queue_size
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.subscribers = []
+        self.stats = {'emitted': 0, 'sampled_out': 0, 'dropped': 0, 'rate_limited': 0, 'written': 0, 'errors': 0}
+        self._queue = deque()
+        self._counters = {}
+        self._tokens = float(max_per_second or 0)
+        self._last_refill = time.monotonic()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    @property
+    def silent(self) -> bool:
+        return self.mode == 'silent'
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def emit(self, source: str, template: str, force: bool = False, **fields):
+        """Queues one record; `template` is formatted with `fields` later, off the caller's thread."""
+        if self.mode == 'silent':
+            return
+        stats = self.stats
+        stats['emitted'] += 1
+        if not force and self.sample_every > 1:
+            n = self._counters.get(source, 0)
+            self._counters[source] = n + 1
+            if n % self.sample_every:
+                stats['sampled_out'] += 1
+                return
+        if len(self._queue) >= self.queue_size:
+            stats['dropped'] += 1
+            return
+        self._queue.append(Record(time.monotonic(), source, template, fields, force))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="aum-telemetry", daemon=True)
+                self._thread.start()
+
+    def _allow_line(self, record: Record) -> bool:
+        """Token bucket on console lines, refilled by the records' own timestamps."""
+        if record.force or not self.max_per_second:
+            return True
+        elapsed = record.timestamp - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.max_per_second, self._tokens + elapsed * self.max_per_second)
+            self._last_refill = record.timestamp
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        self.stats['rate_limited'] += 1
+        return False
+
+    def _write(self, lines):
+        if lines:
+            stream = self.stream or sys.stdout
+            stream.write('\n'.join(lines) + '\n')
+            stream.flush()
+            self.stats['written'] += len(lines)
+
+    def _drain(self):
+        lines = []
+        queue = self._queue
+        while queue:
+            record = queue.popleft()
+            if isinstance(record, threading.Event):
+                # flush() marker: everything queued before it is out once it is set
+                self._write(lines)
+                lines = []
+                record.set()
+                continue
+            for callback in self.subscribers:
+                try:
+                    callback(record)
+                except Exception:
+                    self.stats['errors'] += 1
+            if self._allow_line(record):
+                try:
+                    lines.append(record.format())
+                except Exception:
+                    # Template/field mismatch: drop this line, keep draining
+                    self.stats['errors'] += 1
+        self._write(lines)
+
+    def _run(self):
+        while not (self._closed and not self._queue):
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def flush(self, timeout: float = 5.0):
+        """Blocks until everything queued so far has been written."""
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return
+        marker = threading.Event()
+        self._queue.append(marker)
+        self._wake.set()
+        marker.wait(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+_default_sink = None
+_default_lock = threading.Lock()
+
+def get_sink() -> TelemetrySink:
+    """The process-wide sink, created from AUM_TELEMETRY* environment variables on first use."""
+    global _default_sink
+    if _default_sink is None:
+        with _default_lock:
+            if _default_sink is None:
+                rate = os.environ.get('AUM_TELEMETRY_RATE')
+                _default_sink = TelemetrySink(
+                    mode=os.environ.get('AUM_TELEMETRY', 'console'),
+                    sample_every=int(os.environ.get('AUM_TELEMETRY_SAMPLE', 1)),
+                    max_per_second=float(rate) if rate else None,
+                )
+                atexit.register(_default_sink.close)
+    return _default_sink
+
+def configure(**options) -> TelemetrySink:
+    """Replaces the process-wide sink (same options as TelemetrySink)."""
+    global _default_sink
+    with _default_lock:
+        old, _default_sink = _default_sink, TelemetrySink(**options)
+        atexit.register(_default_sink.close)
+    if old is not None:
+        old.close()
+    return _default_sink
+
+def emit(source: str, template: str, force: bool = False, **fields):
+    get_sink().emit(source, template, force, **fields)
+
+def flush():
+    if _default_sink is not None:
+        _default_sink.flush()
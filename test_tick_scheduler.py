@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+test_tick_scheduler.py - Slot accounting of TickScheduler on a simulated clock.
+Run with: python -m pytest test_tick_scheduler.py
+"""
+
+import math
+
+from tick_scheduler import TickScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        assert seconds >= 0
+        self.now += seconds
+
+def run(policy: str, step: float, period: float = 0.010, duration: float = 1.0):
+    clock = FakeClock()
+    scheduler = TickScheduler(period, policy=policy, clock=clock.clock, sleep=clock.sleep)
+    start = scheduler.start()
+    while clock.now - start < duration:
+        clock.now += step
+        scheduler.wait()
+    return scheduler.stats, clock.now - start
+
+def test_skip_accounts_for_every_slot():
+    # 11 ms steps on a 10 ms grid: every elapsed slot is either a tick or a skip
+    stats, elapsed = run('skip', step=0.011)
+    assert stats.overruns > 0 and stats.skipped > 0
+    assert abs(stats.ticks + stats.skipped - elapsed / 0.010) <= 1
+
+def test_skip_long_overruns():
+    stats, elapsed = run('skip', step=0.035)
+    assert abs(stats.ticks + stats.skipped - elapsed / 0.010) <= 1
+
+def test_on_time_steps_hold_the_rate():
+    stats, elapsed = run('skip', step=0.004)
+    assert stats.overruns == 0 and stats.skipped == 0
+    assert stats.ticks == math.ceil(elapsed / 0.010 - 1e-9)
+
+def test_catch_up_keeps_the_grid():
+    clock = FakeClock()
+    scheduler = TickScheduler(0.010, policy='catch_up', clock=clock.clock, sleep=clock.sleep)
+    scheduler.start()
+    clock.now += 0.035             # one long step finishes in the 30-40 ms slot
+    scheduler.wait()
+    for _ in range(2):             # the next short steps run back to back ...
+        clock.now += 0.001
+        scheduler.wait()
+    assert math.isclose(clock.now, 0.037)
+    clock.now += 0.001
+    scheduler.wait()               # ... until the grid is caught up: sleep to the 40 ms slot
+    assert math.isclose(clock.now, 0.040)
+    assert scheduler.stats.skipped == 0
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+tick_scheduler.py - Deadline-based tick scheduler for the real-time control loops.
+Deadlines are laid out on the monotonic clock from the previous deadline (not
+from when the step finished), so the step rate does not drift with step cost.
+Each tick's period is the base period stretched by a factor (the loop passes
+T_mod). When a step overruns its deadline the policy decides what happens to
+the missed ticks: 'catch_up' runs them back to back (up to max_catch_up),
+'skip' drops the slots that passed entirely and starts the next step at once,
+in the grid slot already in progress. Either way every slot is accounted
+for: ticks + skipped covers the elapsed time. Overruns, skipped ticks and
+wake-up jitter are recorded per run.
+"""
+
+import math
+import time
+
+POLICIES = ('skip', 'catch_up')
+
+class TickStats:
+    """Per-run scheduling statistics; jitter is how late the scheduler woke past a deadline it slept for."""
+
+    def __init__(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.max_overrun = 0.0
+        self.jitter_count = 0
+        self.jitter_mean = 0.0
+        self._jitter_m2 = 0.0
+        self.jitter_max = 0.0
+
+    def add_jitter(self, lateness: float):
+        # Welford update
+        self.jitter_count += 1
+        delta = lateness - self.jitter_mean
+        self.jitter_mean += delta / self.jitter_count
+        self._jitter_m2 += delta * (lateness - self.jitter_mean)
+        self.jitter_max = max(self.jitter_max, lateness)
+
+    @property
+    def jitter_std(self) -> float:
+        return math.sqrt(self._jitter_m2 / self.jitter_count) if self.jitter_count else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'ticks': self.ticks, 'overruns': self.overruns, 'skipped': self.skipped,
+            'max_overrun': self.max_overrun, 'jitter_mean': self.jitter_mean,
+            'jitter_std': self.jitter_std, 'jitter_max': self.jitter_max,
+        }
+
+class TickScheduler:
+    """
+    Call start() once, then wait(stretch) at the end of every step.
+    The stretch factor is clamped to [min_stretch, max_stretch] (a non-finite
+    T_mod maps to max_stretch), so a tick is never shorter or longer than that.
+    """
+
+    def __init__(self, period: float, policy: str = 'skip', max_catch_up: int = None,
+                 min_stretch: float = 0.1, max_stretch: float = 10.0,
+                 clock=time.monotonic, sleep=time.sleep):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown tick policy '{policy}' (expected one of {POLICIES})")
+        self.period = period
+        self.policy = policy
+        self.max_catch_up = max_catch_up
+        self.min_stretch = min_stretch
+        self.max_stretch = max_stretch
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = TickStats()
+        self._deadline = None
+
+    def start(self) -> float:
+        """Starts a new run (fresh stats); the first deadline is one base period away."""
+        self.stats = TickStats()
+        now = self.clock()
+        self._deadline = now
+        return now
+
+    def _tick_period(self, stretch: float) -> float:
+        if not math.isfinite(stretch):
+            stretch = self.max_stretch
+        return self.period * min(max(stretch, self.min_stretch), self.max_stretch)
+
+    def wait(self, stretch: float = 1.0) -> float:
+        """
+        Blocks until the next deadline (previous deadline + stretched period).
+        Returns how late the step finished relative to it (0 when on time).
+        """
+        if self._deadline is None:
+            self.start()
+        stats = self.stats
+        stats.ticks += 1
+        tick = self._tick_period(stretch)
+        deadline = self._deadline + tick
+        now = self.clock()
+
+        if now <= deadline:
+            self.sleep(deadline - now)
+            stats.add_jitter(max(self.clock() - deadline, 0.0))
+            self._deadline = deadline
+            return 0.0
+
+        # 1. Overrun: the step finished after its deadline
+        overrun = now - deadline
+        stats.overruns += 1
+        stats.max_overrun = max(stats.max_overrun, overrun)
+        missed = int(overrun // tick)
+
+        # 2. Apply the policy to the ticks that were missed entirely
+        if self.policy == 'catch_up' and (self.max_catch_up is None or missed <= self.max_catch_up):
+            # Keep the grid; the following steps run without sleeping until it is caught up
+            self._deadline = deadline
+        else:
+            # Drop the slots that passed entirely; the next step runs now, in the slot in progress
+            stats.skipped += missed
+            self._deadline = deadline + missed * tick
+        return overrun
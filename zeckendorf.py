@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+zeckendorf.py - Table-driven Zeckendorf (Fibonacci-base) codec for the Phinary layer.
+Every integer is a sum of non-adjacent Fibonacci numbers, so each digit row is a
+valid base-phi standard form. Bytes go on the wire as fixed-width digit rows:
+23 digits per 16-bit word (~11.5 per byte) against 16 for the DAL pair scheme.
+"""
+
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# Digits needed for one byte (F(14) - 1 = 376 >= 255) and one 16-bit word (F(25) - 1 = 75024 >= 65535)
+BYTE_WIDTH = 12
+WORD_WIDTH = 23
+
+def fibonacci_weights(width: int) -> np.ndarray:
+    """Digit weights F(width+1) .. F(2) = 1, most significant first (int64)."""
+    fib = [1, 2]
+    while len(fib) < width:
+        fib.append(fib[-1] + fib[-2])
+    return np.array(fib[:width][::-1], dtype=np.int64)
+
+def max_value(width: int) -> int:
+    """Largest integer representable with `width` Zeckendorf digits: F(width+2) - 1."""
+    weights = fibonacci_weights(width + 1)
+    return int(weights[0]) - 1
+
+def zeckendorf_digits(values, width: int) -> np.ndarray:
+    """
+    Greedy Zeckendorf decomposition of an integer array into (..., width) uint8
+    digit rows, most significant first. One vectorized pass per digit position.
+    """
+    rest = np.array(values, dtype=np.int64)
+    if rest.size and (rest.min() < 0 or rest.max() > max_value(width)):
+        raise ValueError(f"values out of range for {width} Zeckendorf digits")
+    digits = np.zeros(rest.shape + (width,), dtype=np.uint8)
+    for i, weight in enumerate(fibonacci_weights(width)):
+        take = rest >= weight
+        digits[..., i] = take
+        rest -= weight * take
+    return digits
+
+def digits_to_values(digits: np.ndarray) -> np.ndarray:
+    """Inverse of zeckendorf_digits for (..., width) digit rows (any digit values)."""
+    digits = np.asarray(digits)
+    weights = fibonacci_weights(digits.shape[-1])
+    if digits.size and digits.max() <= 1 and max_value(digits.shape[-1]) < (1 << 24):
+        # Exact in float32 here, and BLAS is far faster than an int64 matmul
+        return (digits.astype(np.float32) @ weights.astype(np.float32)).astype(np.int64)
+    return digits.astype(np.int64) @ weights
+
+@lru_cache(maxsize=None)
+def digit_table(width: int, n_values: int) -> np.ndarray:
+    """Precomputed (n_values, width) digit rows for 0 .. n_values-1 (read-only)."""
+    table = zeckendorf_digits(np.arange(n_values), width)
+    table.flags.writeable = False
+    return table
+
+@lru_cache(maxsize=None)
+def word_key_tables() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lookup tables for 23-bit packed word keys (digit i of a word is key bit 22-i):
+    value -> key for encoding, and the key's high 11 / low 12 bits -> partial value.
+    """
+    weights = fibonacci_weights(WORD_WIDTH)
+    bit_values = 1 << np.arange(WORD_WIDTH - 1, -1, -1, dtype=np.int64)
+    keys = (digit_table(WORD_WIDTH, 1 << 16).astype(np.int64) @ bit_values).astype(np.uint32)
+    lo = np.arange(1 << 12, dtype=np.int64)
+    lo_values = ((lo[:, None] >> np.arange(12)) & 1) @ weights[::-1][:12]
+    hi = np.arange(1 << 11, dtype=np.int64)
+    hi_values = ((hi[:, None] >> np.arange(11)) & 1) @ weights[::-1][12:]
+    for table in (keys, hi_values, lo_values):
+        table.flags.writeable = False
+    return keys, hi_values, lo_values
+
+# Byte offset and left shift of word k inside a group of 8 packed words (8 * 23 bits = 23 bytes)
+_GROUP_LAYOUT = [((WORD_WIDTH * k) // 8, 32 - WORD_WIDTH - (WORD_WIDTH * k) % 8) for k in range(8)]
+
+def _group_windows(groups: np.ndarray, offset: int) -> np.ndarray:
+    """Big-endian 32-bit window at `offset` in every 24-byte group row (a strided view)."""
+    if groups.shape[0] == 0:
+        return np.zeros(0, dtype='>u4')
+    return np.ndarray(shape=(groups.shape[0],), dtype='>u4', buffer=groups,
+                      offset=offset, strides=(groups.strides[0],))
+
+def _pack_word_keys(keys: np.ndarray) -> np.ndarray:
+    """Bit-concatenates 23-bit word keys into a packed digit stream (uint8)."""
+    n_groups = -(-keys.size // 8)
+    grouped = np.zeros((n_groups, 8), dtype=np.uint32)
+    grouped.reshape(-1)[:keys.size] = keys
+    out = np.zeros((n_groups, 24), dtype=np.uint8)
+    for k, (offset, shift) in enumerate(_GROUP_LAYOUT):
+        window = _group_windows(out, offset)
+        window |= grouped[:, k] << shift
+    return out[:, :WORD_WIDTH].reshape(-1)[:-(-keys.size * WORD_WIDTH // 8)]
+
+def _unpack_word_keys(packed: np.ndarray, n_words: int) -> np.ndarray:
+    """Inverse of _pack_word_keys: extracts n_words 23-bit keys from packed digits."""
+    n_groups = -(-n_words // 8)
+    n_bytes = min(packed.size, n_groups * WORD_WIDTH)
+    body = np.zeros(n_groups * WORD_WIDTH, dtype=np.uint8)
+    body[:n_bytes] = packed[:n_bytes]
+    groups = np.zeros((n_groups, 24), dtype=np.uint8)
+    groups[:, :WORD_WIDTH] = body.reshape(n_groups, WORD_WIDTH)
+    keys = np.empty((n_groups, 8), dtype=np.uint32)
+    for k, (offset, shift) in enumerate(_GROUP_LAYOUT):
+        keys[:, k] = (_group_windows(groups, offset) >> shift) & ((1 << WORD_WIDTH) - 1)
+    return keys.reshape(-1)[:n_words]
+
+def is_canonical(digits: np.ndarray) -> bool:
+    """True if all digits are 0/1 with no two adjacent 1s."""
+    digits = np.asarray(digits)
+    if digits.size and digits.max() > 1:
+        return False
+    return not (digits[..., :-1] & digits[..., 1:]).any()
+
+def encode_bytes_packed(data) -> tuple[np.ndarray, int]:
+    """
+    Encodes a bytes-like payload straight to packed digits (np.packbits layout):
+    WORD_WIDTH digits per big-endian 16-bit word, plus BYTE_WIDTH digits for a
+    trailing odd byte. Returns (packed, n_digits); the length alone identifies the tail.
+    """
+    payload = np.frombuffer(data, dtype=np.uint8)
+    n_words = payload.size // 2
+    keys, _, _ = word_key_tables()
+    packed = _pack_word_keys(keys[payload[:2 * n_words].view('>u2')])
+    n_digits = encoded_length(payload.size)
+    if payload.size % 2:
+        # Splice the 12 tail digits in after the last (possibly partial) word byte
+        head_bits = n_words * WORD_WIDTH
+        aligned = head_bits // 8
+        tail = np.concatenate([
+            np.unpackbits(packed[aligned:], count=head_bits - 8 * aligned),
+            digit_table(BYTE_WIDTH, 1 << 8)[payload[-1]],
+        ])
+        packed = np.concatenate([packed[:aligned], np.packbits(tail)])
+    return packed, n_digits
+
+def encode_bytes(data) -> np.ndarray:
+    """Encodes a bytes-like payload as a flat, unpacked uint8 Zeckendorf digit stream."""
+    packed, n_digits = encode_bytes_packed(data)
+    return np.unpackbits(packed, count=n_digits)
+
+def encoded_length(n_bytes: int) -> int:
+    """Number of digits (moduli) encode_bytes produces for an n_bytes payload."""
+    return (n_bytes // 2) * WORD_WIDTH + (n_bytes % 2) * BYTE_WIDTH
+
+def decode_packed(packed: np.ndarray, n_digits: int) -> bytes:
+    """Decodes packed digits from encode_bytes_packed; raises ValueError on corruption."""
+    n_words, tail = divmod(n_digits, WORD_WIDTH)
+    if tail not in (0, BYTE_WIDTH):
+        raise ValueError(f"invalid Zeckendorf stream length {n_digits}")
+    _, hi_values, lo_values = word_key_tables()
+    keys = _unpack_word_keys(packed, n_words)
+    if (keys & (keys >> 1)).any():
+        raise ValueError("non-canonical Zeckendorf digits in stream")
+    values = hi_values[keys >> 12] + lo_values[keys & 0xFFF]
+    if values.size and values.max() > 0xFFFF:
+        raise ValueError("Zeckendorf word out of 16-bit range")
+    payload = values.astype('>u2').tobytes()
+    if tail:
+        head_bits = n_words * WORD_WIDTH
+        tail_digits = np.unpackbits(packed[head_bits // 8:], count=head_bits % 8 + tail)[head_bits % 8:]
+        if not is_canonical(tail_digits):
+            raise ValueError("non-canonical Zeckendorf digits in stream")
+        byte = int(digits_to_values(tail_digits))
+        if byte > 0xFF:
+            raise ValueError("Zeckendorf tail byte out of range")
+        payload += bytes([byte])
+    return payload
+
+def decode_digits(digits: np.ndarray) -> bytes:
+    """Decodes an unpacked digit stream produced by encode_bytes."""
+    digits = np.asarray(digits, dtype=np.uint8)
+    if digits.size and digits.max() > 1:
+        raise ValueError("non-binary digits in Zeckendorf stream")
+    return decode_packed(np.packbits(digits), digits.size)
+
+# --- Arithmetic on encoded arrays ---
+# Operands are (..., width) digit rows, most significant first, exactly as they
+# sit in a DAL Zeckendorf stream; rows of different widths align on the least
+# significant digit. Arithmetic works on the digits alone and has no width
+# limit; only to_int64 (reading values back out) is bounded by MAX_WIDTH.
+
+MAX_WIDTH = 90
+
+def width_for(value: int) -> int:
+    """Smallest digit width that can represent value."""
+    width = 1
+    while max_value(width) < value:
+        width += 1
+    return width
+
+def from_int64(values, width: int = None) -> np.ndarray:
+    """Encodes non-negative integers as canonical digit rows (width defaults to the minimum)."""
+    values = np.asarray(values, dtype=np.int64)
+    if width is None:
+        width = width_for(int(values.max())) if values.size else 1
+    return zeckendorf_digits(values, width)
+
+def to_int64(digits: np.ndarray) -> np.ndarray:
+    """Values of (possibly non-canonical) digit rows."""
+    digits = np.asarray(digits)
+    if digits.shape[-1] > MAX_WIDTH:
+        raise ValueError(f"width {digits.shape[-1]} exceeds int64 range (max {MAX_WIDTH})")
+    return digits_to_values(digits)
+
+def stream_digits(packed: np.ndarray, n_digits: int) -> np.ndarray:
+    """
+    (n_words, WORD_WIDTH) digit rows of the 16-bit words in a packed DAL Zeckendorf
+    stream (TorsionModuli.packed / .size), without decoding it back to bytes.
+    A trailing odd byte is not a whole word and is left out.
+    """
+    keys = _unpack_word_keys(packed, n_digits // WORD_WIDTH)
+    bits = np.unpackbits(keys.astype('>u4').view(np.uint8).reshape(-1, 4), axis=1)
+    return bits[:, 32 - WORD_WIDTH:]
+
+def _align(*operands: np.ndarray, width: int = None) -> list[np.ndarray]:
+    """Left-pads digit rows with zeros to a common width (at least `width`)."""
+    operands = [np.asarray(d) for d in operands]
+    width = max([d.shape[-1] for d in operands] + [width or 0])
+    return [
+        np.concatenate([np.zeros(d.shape[:-1] + (width - d.shape[-1],), dtype=d.dtype), d], axis=-1)
+        if d.shape[-1] < width else d
+        for d in operands
+    ]
+
+_NARROW_DIGIT_LIMIT = 1 << 14
+
+def _merge_pairs(lsb: np.ndarray, parity: int) -> bool:
+    """011 -> 100 on the disjoint digit pairs (i, i+1) with i % 2 == parity (LSB-first rows)."""
+    low, high = lsb[..., parity:-2:2], lsb[..., parity + 1:-1:2]
+    n = min(low.shape[-1], high.shape[-1])
+    merge = (low[..., :n] > 0) & (high[..., :n] > 0)
+    if not merge.any():
+        return False
+    low[..., :n] -= merge
+    high[..., :n] -= merge
+    lsb[..., parity + 2::2][..., :n] += merge
+    return True
+
+def _split_twos(lsb: np.ndarray) -> bool:
+    """
+    0200 -> 1001 at every position at once (LSB-first rows): 2*F(k) = F(k+1) + F(k-2),
+    applied q = d // 2 times. At the two lowest positions 2*1 = 2 and 2*2 = 3 + 1.
+    """
+    q = lsb >> 1
+    if not q.any():
+        return False
+    lsb -= 2 * q
+    lsb[..., 1:] += q[..., :-1]
+    lsb[..., 0] += q[..., 1]
+    lsb[..., :-2] += q[..., 2:]
+    return True
+
+def normalize(digits: np.ndarray, width: int = None) -> np.ndarray:
+    """
+    Canonical form of arbitrary non-negative digit rows (digits > 1, runs of
+    adjacent 1s), by digit-level carries: each round applies 0200 -> 1001 at
+    every position, then 011 -> 100 on even and odd pairs, vectorized across
+    positions and rows, until nothing changes. Every round raises the digit
+    vector lexicographically from the top while keeping its value, so this
+    terminates; no integer value is ever formed. Rows that are already
+    canonical come back unchanged. Width grows if the value needs it.
+    """
+    digits = np.asarray(digits)
+    width = width or digits.shape[-1]
+    if width >= digits.shape[-1] and is_canonical(digits):
+        return _align(digits.astype(np.uint8, copy=False), width=width)[0]
+
+    # Work least significant digit first, with two zero guard digits on top.
+    # A round grows the largest digit M to at most 1.5*M + 3, so int16 is safe
+    # below _NARROW_DIGIT_LIMIT; anything larger (e.g. column counts) goes to int64.
+    dtype = np.int16 if digits.size and digits.max() < _NARROW_DIGIT_LIMIT else np.int64
+    lsb = np.zeros(digits.shape[:-1] + (digits.shape[-1] + 2,), dtype=dtype)
+    lsb[..., :digits.shape[-1]] = digits[..., ::-1]
+    while True:
+        if lsb[..., -2:].any():
+            lsb = np.concatenate([lsb, np.zeros_like(lsb)], axis=-1)
+        if lsb.dtype == np.int16 and lsb.max() >= _NARROW_DIGIT_LIMIT:
+            lsb = lsb.astype(np.int64)
+        changed = _split_twos(lsb)
+        changed |= _merge_pairs(lsb, 0)
+        changed |= _merge_pairs(lsb, 1)
+        if not changed:
+            break
+
+    used = lsb.reshape(-1, lsb.shape[-1]).any(axis=0).nonzero()[0]
+    width = max(width, int(used[-1]) + 1 if used.size else 0)
+    return lsb[..., :width][..., ::-1].astype(np.uint8)
+
+def add(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Elementwise sum of two digit-row arrays (broadcasting), as canonical rows."""
+    a, b = _align(a, b)
+    # Digitwise addition is exact (digits up to 2); normalization does the carries.
+    # The sum of two w-digit values always fits in w + 2 digits.
+    total = a.astype(np.uint8) + b.astype(np.uint8)
+    return normalize(total, width=total.shape[-1] + 2)
+
+def compare(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Elementwise comparison (-1, 0, 1 as int8) of two digit-row arrays. For canonical
+    rows, Zeckendorf order is lexicographic from the most significant digit, so the
+    result comes from the first differing digit without reconstructing values.
+    """
+    a, b = normalize(a), normalize(b)
+    a, b = _align(a, b)
+    diff = a.astype(np.int8) - b.astype(np.int8)
+    if diff.shape[-1] == 0:
+        return np.zeros(diff.shape[:-1], dtype=np.int8)
+    first = np.argmax(diff != 0, axis=-1)
+    return np.take_along_axis(diff, first[..., None], axis=-1)[..., 0]
+
+def total(digits: np.ndarray, axis=None) -> np.ndarray:
+    """
+    Sum of encoded values over `axis` of the row array (all rows by default),
+    computed as per-position digit counts times the Fibonacci weights.
+    """
+    digits = np.asarray(digits)
+    if axis is None:
+        counts = digits.reshape(-1, digits.shape[-1]).sum(axis=0, dtype=np.int64)
+    else:
+        axis = axis % (digits.ndim - 1)
+        counts = digits.sum(axis=axis, dtype=np.int64)
+    return counts @ fibonacci_weights(digits.shape[-1])
+
+def _throughput_report(n_bytes: int = 16 << 20):
+    """Prints moduli/byte and codec MB/s for the Zeckendorf codec vs the DAL pair scheme."""
+    from dal_phinary_engine import PAIR_TABLE, PAIR_DECODE_TABLE
+
+    payload = np.random.randint(0, 256, n_bytes, dtype=np.uint8).tobytes()
+    mb = n_bytes / 1e6
+    word_key_tables()  # build the tables outside the timed region
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return result, mb / (time.perf_counter() - start)
+
+    pair_digits, pair_enc = timed(lambda: np.unpackbits(PAIR_TABLE[np.frombuffer(payload, np.uint8)].view(np.uint8)))
+    _, pair_dec = timed(lambda: PAIR_DECODE_TABLE[np.packbits(pair_digits).view(np.uint16)].astype(np.uint8).tobytes())
+    (zeck_packed, zeck_size), zeck_enc = timed(lambda: encode_bytes_packed(payload))
+    zeck_payload, zeck_dec = timed(lambda: decode_packed(zeck_packed, zeck_size))
+    assert zeck_payload == payload
+
+    print(f"Payload: {mb:.1f} MB")
+    print(f"{'scheme':<12} {'moduli/byte':>12} {'encode MB/s':>12} {'decode MB/s':>12}")
+    print(f"{'pair':<12} {pair_digits.size / n_bytes:>12.2f} {pair_enc:>12.1f} {pair_dec:>12.1f}")
+    print(f"{'zeckendorf':<12} {zeck_size / n_bytes:>12.2f} {zeck_enc:>12.1f} {zeck_dec:>12.1f}")
+
+if __name__ == "__main__":
+    _throughput_report()